@@ -1,12 +1,11 @@
 """Venue model using SQLModel."""
 
 from datetime import datetime
-from decimal import Decimal
 from typing import Any
 from uuid import UUID
 
 from sqlalchemy import Column
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION, JSONB
 from sqlmodel import Field, SQLModel
 
 from cityvibe_core.models.base import TimestampMixin, UUIDMixin
@@ -20,8 +19,10 @@ class VenueBase(SQLModel):
     city: str = Field(max_length=100, index=True)
     state: str | None = Field(default=None, max_length=50)
     country: str = Field(default="US", max_length=50)
-    latitude: Decimal | None = Field(default=None, max_digits=10, decimal_places=8)
-    longitude: Decimal | None = Field(default=None, max_digits=11, decimal_places=8)
+    # Stored as float64 (~15 significant digits), which comfortably exceeds
+    # geocoding accuracy and avoids per-row Decimal construction on hydration.
+    latitude: float | None = Field(default=None, sa_column=Column(DOUBLE_PRECISION, nullable=True))
+    longitude: float | None = Field(default=None, sa_column=Column(DOUBLE_PRECISION, nullable=True))
     venue_type: str | None = Field(default=None, max_length=50)
     scraper_config: dict[str, Any] | None = Field(
         default=None, sa_column=Column(JSONB, nullable=True)
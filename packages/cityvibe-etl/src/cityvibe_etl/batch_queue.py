@@ -0,0 +1,91 @@
+"""Dynamic batching queue for coalescing backend calls."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+# Flush when this many items have accumulated, even within the delay window.
+MAX_BATCH_SIZE = 64
+
+# Maximum time an item waits for more items to coalesce with.
+MAX_DELAY_MS = 20
+
+
+class BatchQueue:
+    """
+    Accumulates submitted items over a short window and flushes them to a
+    single batched backend call.
+
+    Concurrent callers (e.g. multiple scrapers enriching batches at the same
+    time) each submit individual items; the queue coalesces them so the
+    backend sees one large call instead of many small ones. A batch is
+    flushed as soon as `max_batch_size` items are pending, or after
+    `max_delay_ms` elapses, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        flush_fn: Callable[[list[Any]], Awaitable[list[Any]]],
+        max_batch_size: int = MAX_BATCH_SIZE,
+        max_delay_ms: int = MAX_DELAY_MS,
+    ):
+        """
+        Initialize the queue.
+
+        Args:
+            flush_fn: Async callable taking a list of items and returning a
+                list of results in the same order
+            max_batch_size: Flush immediately once this many items are pending
+            max_delay_ms: Flush after this many milliseconds regardless of size
+        """
+        self._flush_fn = flush_fn
+        self.max_batch_size = max_batch_size
+        self.max_delay_ms = max_delay_ms
+        self._pending: list[tuple[Any, asyncio.Future]] = []
+        self._timer: asyncio.Task | None = None
+
+    async def submit(self, item: Any) -> Any:
+        """Submit one item and wait for its result from the batched call."""
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            await self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_after_delay())
+
+        return await future
+
+    async def _flush_after_delay(self) -> None:
+        """Flush whatever has accumulated once the delay window closes."""
+        await asyncio.sleep(self.max_delay_ms / 1000)
+        await self._flush()
+
+    async def _flush(self) -> None:
+        """Issue one backend call for all pending items."""
+        pending, self._pending = self._pending, []
+        timer, self._timer = self._timer, None
+        if timer is not None and timer is not asyncio.current_task():
+            timer.cancel()
+        if not pending:
+            return
+
+        items = [item for item, _ in pending]
+        try:
+            results = await self._flush_fn(items)
+            # Validate inside the try: a wrong-length result must fail the
+            # waiters like any other flush error, not raise unobserved in a
+            # timer task while the submits hang forever.
+            if len(results) != len(items):
+                raise ValueError(
+                    f"flush_fn returned {len(results)} results for {len(items)} items"
+                )
+        except Exception as exc:  # noqa: BLE001 - propagate to all waiters
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for (_, future), result in zip(pending, results, strict=True):
+            if not future.done():
+                future.set_result(result)
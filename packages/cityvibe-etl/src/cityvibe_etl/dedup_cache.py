@@ -0,0 +1,60 @@
+"""Fixed-size in-process cache of recently seen event signatures."""
+
+import array
+import time
+
+# 2^18 slots * 8 bytes ≈ 2MB.
+SLOT_BITS = 18
+
+# Coarse clock: monotonic nanoseconds shifted by 26 bits ≈ 67ms per tick,
+# which wraps a 16-bit timestamp roughly every 73 minutes.
+TICK_SHIFT = 26
+
+DEFAULT_TTL_SECONDS = 3600
+
+
+class DedupCache:
+    """
+    Lock-free, allocation-free membership cache for event signatures.
+
+    Each slot is a packed uint64 in a flat `array.array`: the top 48 bits hold
+    the high bits of the xxhash signature, the low 16 bits a coarse timestamp.
+    A lookup is two integer ops against the array — no per-entry objects and
+    no locking needed under the GIL. Stale or colliding slots are simply
+    overwritten, so a hit may rarely be missed but is never falsely reported
+    beyond the 48-bit hash collision probability.
+    """
+
+    def __init__(self, slot_bits: int = SLOT_BITS, ttl_seconds: int = DEFAULT_TTL_SECONDS):
+        """
+        Initialize the cache.
+
+        Args:
+            slot_bits: log2 of the number of slots
+            ttl_seconds: How long a signature counts as "seen"; capped by the
+                16-bit timestamp wraparound (~73 minutes)
+        """
+        self._mask = (1 << slot_bits) - 1
+        self._slots = array.array("Q", bytes(8 << slot_bits))
+        ttl_ticks = (ttl_seconds * 1_000_000_000) >> TICK_SHIFT
+        self._ttl_ticks = max(1, min(ttl_ticks, 0xFFFE))
+
+    def check_and_set(self, signature: int) -> bool:
+        """
+        Check whether a signature was seen within the TTL, recording it if not.
+
+        Args:
+            signature: 64-bit event signature (e.g. from
+                `EventDeduplicator._generate_signature`)
+
+        Returns:
+            True if the signature was already present and fresh, False if it
+            was recorded as new
+        """
+        idx = signature & self._mask
+        slot = self._slots[idx]
+        now = time.monotonic_ns() >> TICK_SHIFT
+        if slot >> 16 == signature >> 16 and ((now - slot) & 0xFFFF) < self._ttl_ticks:
+            return True
+        self._slots[idx] = (signature & 0xFFFF_FFFF_FFFF_0000) | (now & 0xFFFF)
+        return False
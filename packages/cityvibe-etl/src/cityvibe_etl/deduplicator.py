@@ -1,5 +1,18 @@
 """Event deduplication logic."""
 
+from collections import defaultdict
+from datetime import datetime
+
+import numpy as np
+import xxhash
+from rapidfuzz import fuzz, process
+
+# Similarity score (0-100) above which two titles are considered a fuzzy match.
+FUZZY_SCORE_CUTOFF = 85
+
+# Events whose start times differ by more than this are never duplicates.
+TIME_WINDOW_SECONDS = 3600
+
 
 class EventDeduplicator:
     """
@@ -9,6 +22,14 @@ class EventDeduplicator:
     - Exact match: Same title + same start_time + same venue
     - Fuzzy match: Similar title (Levenshtein) + overlapping time window
     - Signature hashing: Hash of normalized fields for fast lookup
+
+    Fuzzy matching is computed per bucket with `rapidfuzz.process.cdist`,
+    which runs a bit-parallel Levenshtein in C across all title pairs instead
+    of calling a Python comparison O(n²) times. Events are first bucketed by a
+    coarse blocking key (title prefix, start hour, venue) so the quadratic
+    comparison only runs within small buckets. Normalized titles, locations,
+    and timestamps are materialized once per batch so no string is
+    re-normalized inside the pairwise comparisons.
     """
 
     async def deduplicate(self, events: list[dict]) -> list[dict]:
@@ -19,22 +40,130 @@ class EventDeduplicator:
             events: List of event dictionaries to deduplicate
 
         Returns:
-            List of deduplicated events
+            List of deduplicated events, keeping the first occurrence of each
+            duplicate group
+        """
+        if len(events) < 2:
+            return events
+
+        # Exact pass: drop events whose normalized signature was already seen.
+        seen: set[int] = set()
+        unique: list[dict] = []
+        for event in events:
+            signature = self._generate_signature(event)
+            if signature in seen:
+                continue
+            seen.add(signature)
+            unique.append(event)
+        events = unique
+
+        # Normalize once per batch instead of once per comparison.
+        norm_titles = [(e.get("title") or "").casefold().strip() for e in events]
+        norm_locs = [(e.get("location") or "").casefold() for e in events]
+        timestamps = [self._start_timestamp(e) for e in events]
+
+        # Blocking: only events sharing a coarse key can be duplicates, which
+        # turns one O(n²) fuzzy pass into many small per-bucket passes.
+        buckets: dict[tuple, list[int]] = defaultdict(list)
+        for idx, event in enumerate(events):
+            ts = timestamps[idx]
+            hour = int(ts // TIME_WINDOW_SECONDS) if ts is not None else None
+            buckets[(norm_titles[idx][:4], hour, event.get("venue_id"))].append(idx)
+
+        duplicates: set[int] = set()
+        for indices in buckets.values():
+            if len(indices) < 2:
+                continue
+            duplicates.update(
+                self._find_bucket_duplicates(indices, norm_titles, norm_locs, timestamps)
+            )
+
+        return [e for i, e in enumerate(events) if i not in duplicates]
+
+    def _find_bucket_duplicates(
+        self,
+        indices: list[int],
+        norm_titles: list[str],
+        norm_locs: list[str],
+        timestamps: list[float | None],
+    ) -> set[int]:
+        """Fuzzy-compare the events in one bucket, returning duplicate indices."""
+        titles = [norm_titles[i] for i in indices]
+
+        # One C-level matrix op over all title pairs in the bucket; workers=-1
+        # releases the GIL and spreads the computation across cores.
+        scores = process.cdist(
+            titles,
+            titles,
+            scorer=fuzz.ratio,
+            score_cutoff=FUZZY_SCORE_CUTOFF,
+            workers=-1,
+            dtype=np.uint8,
+        )
+
+        duplicates: set[int] = set()
+        for i, j in np.argwhere(scores >= FUZZY_SCORE_CUTOFF):
+            if j <= i or indices[j] in duplicates:
+                continue
+            if self._fuzzy_match_indexed(indices[i], indices[j], norm_titles, norm_locs, timestamps):
+                duplicates.add(indices[j])
+        return duplicates
+
+    def _fuzzy_match_indexed(
+        self,
+        i: int,
+        j: int,
+        norm_titles: list[str],
+        norm_locs: list[str],
+        timestamps: list[float | None],
+    ) -> bool:
+        """Check if events i and j are likely duplicates, using batch caches."""
+        if fuzz.ratio(norm_titles[i], norm_titles[j]) < FUZZY_SCORE_CUTOFF:
+            return False
+        if norm_locs[i] and norm_locs[j] and fuzz.ratio(norm_locs[i], norm_locs[j]) < FUZZY_SCORE_CUTOFF:
+            return False
+        ts1, ts2 = timestamps[i], timestamps[j]
+        if ts1 is None or ts2 is None:
+            # Without timestamps we fall back on title similarity alone.
+            return True
+        return abs(ts1 - ts2) <= TIME_WINDOW_SECONDS
+
+    @staticmethod
+    def _start_timestamp(event: dict) -> float | None:
+        """Extract the start time of an event as a POSIX timestamp."""
+        start_time = event.get("start_time")
+        if isinstance(start_time, datetime):
+            return start_time.timestamp()
+        if isinstance(start_time, str):
+            try:
+                return datetime.fromisoformat(start_time).timestamp()
+            except ValueError:
+                return None
+        return None
+
+    def _generate_signature(self, event: dict) -> int:
         """
-        # TODO: Implement deduplication logic
-        # 1. Generate signatures for each event
-        # 2. Check against existing events in database
-        # 3. Use fuzzy matching for similar events
-        # 4. Return only new/updated events
-        return events
-
-    def _generate_signature(self, event: dict) -> str:
-        """Generate a deduplication signature for an event."""
-        # TODO: Hash normalized fields (title, start_time, venue_id, location)
-        _ = event  # Will be used when implementing
-        return ""  # Stub return
+        Generate a deduplication signature for an event.
+
+        Hashes the normalized fields (title, start_time, venue_id) with
+        xxh3_64 into an integer, so callers can bucket signatures in a plain
+        `dict[int, ...]` without allocating hex digests.
+        """
+        title = (event.get("title") or "").strip().casefold()
+        ts = self._start_timestamp(event)
+        buf = f"{title}|{int(ts) if ts is not None else ''}|{event.get('venue_id', '')}".encode()
+        return xxhash.xxh3_64_intdigest(buf)
 
     def _fuzzy_match(self, event1: dict, event2: dict) -> bool:
-        """Check if two events are likely duplicates using fuzzy matching."""
-        # TODO: Implement Levenshtein distance matching
-        return False
+        """
+        Check if two events are likely duplicates using fuzzy matching.
+
+        Thin wrapper over `_fuzzy_match_indexed` for per-pair callers outside
+        the batch path; `deduplicate` builds the normalized caches once and
+        uses the indexed form directly.
+        """
+        pair = [event1, event2]
+        norm_titles = [(e.get("title") or "").casefold().strip() for e in pair]
+        norm_locs = [(e.get("location") or "").casefold() for e in pair]
+        timestamps = [self._start_timestamp(e) for e in pair]
+        return self._fuzzy_match_indexed(0, 1, norm_titles, norm_locs, timestamps)
@@ -1,5 +1,26 @@
 """Event enrichment logic."""
 
+import asyncio
+import re
+
+import httpx
+
+from cityvibe_etl.batch_queue import BatchQueue
+
+# Public Nominatim endpoint; override via the constructor for a self-hosted
+# or commercial geocoder.
+GEOCODER_URL = "https://nominatim.openstreetmap.org/search"
+
+# Maximum number of in-flight geocoding requests per batch.
+GEOCODE_CONCURRENCY = 10
+
+# Number of texts embedded per model call; small enough to stay OOM-safe.
+EMBED_BATCH_SIZE = 32
+
+# Cap on the combined character count of one embedding batch, so a batch of
+# long descriptions shrinks to fewer items instead of exhausting memory.
+MAX_EMBED_CHARS = 150_000
+
 
 class EventEnricher:
     """
@@ -10,8 +31,51 @@ class EventEnricher:
     - Tag extraction: Extract tags from description/title
     - Embedding generation: Generate vector embeddings for semantic search
     - Image processing: Download and process event images
+
+    A single keep-alive `httpx.AsyncClient` is shared across all geocoding
+    calls so the TLS handshake, DNS lookup, and connection setup are paid once
+    per batch instead of once per address. Callers owning an enricher should
+    `await enricher.aclose()` when done.
+
+    Embeddings run on an INT8-quantized ONNX model (e.g. bge-small-en-v1.5
+    quantized with optimum's ORTQuantizer) when `embedding_model_path` is
+    configured; quantized ONNX Runtime inference halves memory bandwidth and
+    uses VNNI integer matmuls on supported CPUs. Without a model path the
+    embedding step is a no-op.
     """
 
+    def __init__(
+        self,
+        geocoder_url: str = GEOCODER_URL,
+        embed_batch_size: int = EMBED_BATCH_SIZE,
+        max_embed_chars: int = MAX_EMBED_CHARS,
+        embedding_model_path: str | None = None,
+        embedding_tokenizer_path: str | None = None,
+    ):
+        self.geocoder_url = geocoder_url
+        self.embed_batch_size = embed_batch_size
+        self.max_embed_chars = max_embed_chars
+        self.embedding_model_path = embedding_model_path
+        self.embedding_tokenizer_path = embedding_tokenizer_path
+        self._onnx_session = None
+        self._tokenizer = None
+        # Scraped batches cluster heavily on a handful of venue addresses, so
+        # a small in-memory cache eliminates most repeat geocoder requests.
+        self._geo_cache: dict[str, tuple[float, float] | None] = {}
+        self._http = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+            timeout=10.0,
+        )
+        # Dynamic batching: concurrent enrich() callers coalesce into one
+        # backend call per short window instead of one call each.
+        self._embed_queue = BatchQueue(self._embed_texts_bucketed)
+        self._geocode_queue = BatchQueue(self._geocode_batch)
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        await self._http.aclose()
+
     async def enrich(self, events: list[dict]) -> list[dict]:
         """
         Enrich a list of events with additional data.
@@ -22,32 +86,241 @@ class EventEnricher:
         Returns:
             List of enriched events
         """
-        # TODO: Implement enrichment logic
-        # for event in events:
-        #     if event.get("address") and not event.get("latitude"):
-        #         coords = await self.geocode(event["address"])
-        #         event["latitude"], event["longitude"] = coords
-        #
-        #     if not event.get("tags"):
-        #         event["tags"] = await self.extract_tags(event)
-        #
-        #     if not event.get("embedding"):
-        #         event["embedding"] = await self.generate_embedding(event)
+        # Geocode through the dynamic batching queue so lookups from
+        # concurrent enrich() calls coalesce into shared batches.
+        needs_geocode = [e for e in events if e.get("address") and not e.get("latitude")]
+        if needs_geocode:
+
+            async def _geocode_one(event: dict) -> None:
+                coords = await self._geocode_queue.submit(event["address"])
+                if coords:
+                    event["latitude"], event["longitude"] = coords
+
+            await asyncio.gather(*(_geocode_one(e) for e in needs_geocode))
+
+        for event in events:
+            if not event.get("tags"):
+                event["tags"] = await self.extract_tags(event)
+
+        # Embed in one batched call: per-event model calls waste most of their
+        # time on per-call overhead rather than inference.
+        needs_embedding = [e for e in events if not e.get("embedding")]
+        if needs_embedding:
+            embeddings = await self.generate_embeddings(needs_embedding)
+            for event, embedding in zip(needs_embedding, embeddings, strict=True):
+                event["embedding"] = embedding
+
         return events
 
-    async def geocode(self, address: str) -> tuple[float, float]:
-        """Geocode an address to lat/lng coordinates."""
-        # TODO: Use geocoding service from cityvibe-common
-        _ = address  # Will be used when implementing
-        return (0.0, 0.0)  # Stub return
+    async def geocode(self, address: str) -> tuple[float, float] | None:
+        """
+        Geocode an address to lat/lng coordinates.
+
+        Args:
+            address: Free-form address to look up
+
+        Returns:
+            (latitude, longitude) tuple, or None when the address cannot be
+            resolved
+        """
+        key = re.sub(r"\s+", " ", address.strip().casefold())
+        if key in self._geo_cache:
+            return self._geo_cache[key]
+
+        try:
+            response = await self._http.get(
+                self.geocoder_url,
+                params={"q": address, "format": "json", "limit": 1},
+            )
+            response.raise_for_status()
+            results = response.json()
+            coords = (
+                (float(results[0]["lat"]), float(results[0]["lon"])) if results else None
+            )
+        except (httpx.HTTPError, ValueError, KeyError, TypeError):
+            # Geocoder hiccups — transport errors, error statuses, but also
+            # non-JSON bodies or payloads missing lat/lon — must not fail
+            # enrichment; leave the address unresolved and uncached so a
+            # later batch can retry it.
+            return None
+        # Misses are cached too, so an unresolvable address is only tried once.
+        self._geo_cache[key] = coords
+        return coords
+
+    async def _geocode_batch(self, addresses: list[str]) -> list[tuple[float, float] | None]:
+        """Geocode a coalesced batch of addresses with bounded concurrency."""
+        sem = asyncio.Semaphore(GEOCODE_CONCURRENCY)
+
+        async def _one(address: str) -> tuple[float, float] | None:
+            async with sem:
+                return await self.geocode(address)
+
+        return list(await asyncio.gather(*(_one(a) for a in addresses)))
 
     async def extract_tags(self, event: dict) -> list[str]:
         """Extract tags from event description and title."""
         # TODO: Implement tag extraction (ML model or keyword matching)
         return []
 
+    async def generate_embeddings(self, events: list[dict]) -> list[list[float]]:
+        """
+        Generate vector embeddings for a batch of events.
+
+        Args:
+            events: Events to embed; title and description are concatenated
+                into the embedding input text
+
+        Returns:
+            One embedding per event, in input order
+        """
+        texts = [self._embedding_text(e) for e in events]
+        if not texts:
+            return []
+        # Submit per text so texts from concurrent callers share batches.
+        return list(await asyncio.gather(*(self._embed_queue.submit(t) for t in texts)))
+
+    async def _embed_texts_bucketed(self, texts: list[str]) -> list[list[float]]:
+        """
+        Embed a batch of texts in length-sorted slices.
+
+        Smart batching: sorting by length means each model call pads to its
+        own short maximum instead of the global maximum; the permutation is
+        inverted before returning so results stay in input order.
+        """
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        sorted_texts = [texts[i] for i in order]
+        batches = self._slice_batches(sorted_texts)
+
+        # Prefetch: prepare batch k+1 in a worker thread while the model call
+        # for batch k is in flight, so CPU-side preparation (tokenization)
+        # hides behind inference instead of serializing with it. The queue is
+        # bounded so at most two prepared batches are held in memory.
+        prepared: asyncio.Queue = asyncio.Queue(maxsize=2)
+
+        async def _producer() -> None:
+            try:
+                for batch in batches:
+                    feed = await asyncio.to_thread(self._prepare_batch, batch)
+                    await prepared.put((batch, feed))
+            finally:
+                # Always enqueue the sentinel, even when preparation fails
+                # (missing model file, tokenizer error): the consumer must
+                # wake up and re-raise instead of blocking on get() forever.
+                await prepared.put(None)
+
+        producer = asyncio.create_task(_producer())
+        sorted_embeddings: list[list[float]] = []
+        try:
+            while (item := await prepared.get()) is not None:
+                batch_texts, feed = item
+                try:
+                    sorted_embeddings.extend(await self._embed_texts(feed))
+                except (MemoryError, RuntimeError):
+                    # Out-of-memory fallback: embed this batch one text at a
+                    # time so the pipeline keeps making forward progress.
+                    for text in batch_texts:
+                        single = await asyncio.to_thread(self._prepare_batch, [text])
+                        sorted_embeddings.extend(await self._embed_texts(single))
+            # Surface preparation failures from the producer task.
+            await producer
+        finally:
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+
+        embeddings: list[list[float]] = [[] for _ in texts]
+        for pos, idx in enumerate(order):
+            embeddings[idx] = sorted_embeddings[pos]
+        return embeddings
+
+    def _slice_batches(self, texts: list[str]) -> list[list[str]]:
+        """
+        Slice texts into batches capped on both item count and total chars.
+
+        The character cap makes batches of long descriptions shrink to fewer
+        items, keeping peak memory roughly constant per model call.
+        """
+        batches: list[list[str]] = []
+        current: list[str] = []
+        current_chars = 0
+        for text in texts:
+            if current and (
+                len(current) >= self.embed_batch_size
+                or current_chars + len(text) > self.max_embed_chars
+            ):
+                batches.append(current)
+                current, current_chars = [], 0
+            current.append(text)
+            current_chars += len(text)
+        if current:
+            batches.append(current)
+        return batches
+
+    def _prepare_batch(self, texts: list[str]):
+        """
+        CPU-side preparation for one embedding batch.
+
+        With a model configured this tokenizes the texts into the ONNX feed
+        dict; it runs in a worker thread so it overlaps the in-flight
+        inference call.
+        """
+        if self.embedding_model_path is None:
+            return texts
+        self._ensure_model()
+
+        import numpy as np
+
+        encodings = self._tokenizer.encode_batch(texts)
+        feed = {
+            "input_ids": np.array([e.ids for e in encodings], dtype=np.int64),
+            "attention_mask": np.array([e.attention_mask for e in encodings], dtype=np.int64),
+        }
+        input_names = {i.name for i in self._onnx_session.get_inputs()}
+        if "token_type_ids" in input_names:
+            feed["token_type_ids"] = np.zeros_like(feed["input_ids"])
+        return feed
+
+    def _ensure_model(self) -> None:
+        """Lazily load the quantized ONNX session and tokenizer."""
+        if self._onnx_session is not None:
+            return
+
+        import onnxruntime
+        from tokenizers import Tokenizer
+
+        self._onnx_session = onnxruntime.InferenceSession(
+            self.embedding_model_path,
+            providers=["CUDAExecutionProvider", "CPUExecutionProvider"],
+        )
+        self._tokenizer = Tokenizer.from_file(self.embedding_tokenizer_path)
+        # Pad to the longest sequence in each batch; the length-bucketed
+        # driver keeps that maximum small.
+        self._tokenizer.enable_padding()
+
     async def generate_embedding(self, event: dict) -> list[float]:
-        """Generate vector embedding for semantic search."""
-        # TODO: Use embedding service from cityvibe-common
-        _ = event  # Will be used when implementing
-        return []  # Stub return
+        """Generate a vector embedding for a single event.
+
+        Thin wrapper over `generate_embeddings`; batch callers should use
+        that directly.
+        """
+        return (await self.generate_embeddings([event]))[0]
+
+    @staticmethod
+    def _embedding_text(event: dict) -> str:
+        """Build the text fed to the embedding model for an event."""
+        return f"{event.get('title') or ''} {event.get('description') or ''}".strip()
+
+    async def _embed_texts(self, batch) -> list[list[float]]:
+        """
+        Run one embedding model call over a prepared batch.
+
+        Takes the feed dict built by `_prepare_batch` (or the raw texts when
+        no model is configured) and returns the CLS-token embeddings.
+        """
+        if self.embedding_model_path is None:
+            return [[] for _ in batch]  # No model configured
+
+        self._ensure_model()
+        # session.run holds the GIL only briefly inside ORT; run it in a
+        # worker thread so the event loop keeps serving other work.
+        outputs = await asyncio.to_thread(self._onnx_session.run, None, batch)
+        return outputs[0][:, 0].tolist()
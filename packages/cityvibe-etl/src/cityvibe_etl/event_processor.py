@@ -1,9 +1,45 @@
 """Main ETL processor for events."""
 
+import asyncio
+
+import pyarrow as pa
+
+from cityvibe_etl.dedup_cache import DedupCache
 from cityvibe_etl.deduplicator import EventDeduplicator
 from cityvibe_etl.enricher import EventEnricher
 from cityvibe_etl.validator import EventValidator
 
+# Events per pipelined sub-chunk; large enough to amortize per-stage
+# overhead, small enough that stages across chunks overlap.
+CHUNK_SIZE = 500
+
+# Scalar columns projected into the validation table. Raw scraper payloads
+# also carry nested fields whose shapes vary per page (e.g. `dates` is a list
+# for some Iamsterdam pages and a dict for others), which Arrow cannot unify
+# into one schema, so only these columns cross into the columnar stage.
+VALIDATE_COLUMNS = (
+    "title",
+    "start_time",
+    "venue_id",
+    "source_url",
+    "price_min",
+    "price_max",
+)
+
+# Columns persisted to the venue_events table, in COPY order.
+SAVE_COLUMNS = (
+    "signature",
+    "title",
+    "description",
+    "start_time",
+    "venue_id",
+    "source_url",
+    "price_min",
+    "price_max",
+    "latitude",
+    "longitude",
+)
+
 
 class EventProcessor:
     """
@@ -14,12 +50,28 @@ class EventProcessor:
     2. Validation - Validate required fields and data quality
     3. Deduplication - Remove duplicate events
     4. Enrichment - Add geocoding, tags, embeddings
+
+    Large batches are split into sub-chunks processed concurrently, so the
+    I/O-bound enrichment of one chunk overlaps with the CPU-bound
+    validation/dedup of the next. The enricher's dynamic batching queues
+    re-coalesce backend calls across chunks.
     """
 
-    def __init__(self):
+    def __init__(self, chunk_size: int = CHUNK_SIZE, db_pool=None):
+        self.chunk_size = chunk_size
+        # Optional asyncpg pool; without one the save stage is skipped.
+        self.db_pool = db_pool
         self.validator = EventValidator()
         self.deduper = EventDeduplicator()
         self.enricher = EventEnricher()
+        # Listing pages repeat the same event many times across a scrape;
+        # the signature cache skips validation and enrichment for events
+        # already seen recently, within or across batches.
+        self.dedup_cache = DedupCache()
+
+    async def aclose(self) -> None:
+        """Release resources held by the pipeline stages."""
+        await self.enricher.aclose()
 
     async def process(self, raw_events: list[dict]) -> dict:
         """
@@ -38,25 +90,134 @@ class EventProcessor:
                 "errors": list[str]
             }
         """
-        # TODO: Implement full pipeline
-        # 1. Normalize
-        # normalized = [self.normalize(e) for e in raw_events]
-        #
-        # 2. Validate
-        # validated = [e for e in normalized if self.validator.validate(e)]
-        #
-        # 3. Deduplicate
-        # deduped = await self.deduper.deduplicate(validated)
-        #
-        # 4. Enrich
-        # enriched = await self.enricher.enrich(deduped)
-        #
-        # 5. Save to database
-        # return await self.save(enriched)
-        return {}  # Stub return
+        chunks = [
+            raw_events[start : start + self.chunk_size]
+            for start in range(0, len(raw_events), self.chunk_size)
+        ]
+        results = await asyncio.gather(*(self._process_chunk(c) for c in chunks))
+
+        return {
+            "events_processed": len(raw_events),
+            "events_new": sum(r["events_new"] for r in results),
+            "events_updated": 0,
+            "events_skipped": sum(r["events_skipped"] for r in results),
+            "errors": [error for r in results for error in r["errors"]],
+        }
+
+    async def _process_chunk(self, chunk: list[dict]) -> dict:
+        """
+        Run the four-stage pipeline over one sub-chunk of events.
+
+        A failing chunk is reported through the `errors` channel and counted
+        as skipped instead of aborting the sibling chunks' work.
+        """
+        try:
+            return await self._run_chunk_pipeline(chunk)
+        except Exception as e:
+            return {
+                "events_new": 0,
+                "events_skipped": len(chunk),
+                "errors": [f"chunk of {len(chunk)} events failed: {e}"],
+            }
+
+    async def _run_chunk_pipeline(self, chunk: list[dict]) -> dict:
+        """The four-stage pipeline body for one sub-chunk."""
+        normalized = [self.normalize(e) for e in chunk]
+
+        # Drop events whose signature was seen recently (within or across
+        # batches) before paying for validation and enrichment.
+        fresh = [
+            e
+            for e in normalized
+            if not self.dedup_cache.check_and_set(self.deduper._generate_signature(e))
+        ]
+
+        # Switch to a columnar (struct-of-arrays) layout for the bulk stages:
+        # validation runs over contiguous columns instead of dict-per-event.
+        # Only the scalar VALIDATE_COLUMNS are projected into the table (plus
+        # a row index to join survivors back to their full dicts), so the
+        # arbitrarily shaped scraper fields never hit Arrow's schema
+        # inference. The CPU-heavy kernels run in a worker thread so other
+        # chunks progress.
+        if fresh:
+            tbl = pa.Table.from_pylist(
+                [
+                    {"_idx": i, **{c: e.get(c) for c in VALIDATE_COLUMNS}}
+                    for i, e in enumerate(fresh)
+                ]
+            )
+            validated_tbl = await asyncio.to_thread(self.validator.validate_table, tbl)
+            validated = [fresh[i] for i in validated_tbl.column("_idx").to_pylist()]
+        else:
+            validated = []
+        deduped = await self.deduper.deduplicate(validated)
+        enriched = await self.enricher.enrich(deduped)
+
+        if enriched and self.db_pool is not None:
+            async with self.db_pool.acquire() as conn:
+                await self.save(enriched, conn)
+
+        return {
+            "events_new": len(enriched),
+            "events_skipped": len(chunk) - len(enriched),
+            "errors": [],
+        }
+
+    async def save(self, events: list[dict], conn) -> int:
+        """
+        Persist enriched events with one COPY instead of per-event INSERTs.
+
+        Streams the batch into a temporary staging table via Postgres binary
+        COPY and upserts into venue_events keyed on the dedup signature, so
+        the whole batch costs a handful of statements and one round-trip per
+        stage rather than one INSERT round-trip per event.
+
+        Args:
+            events: Enriched event dictionaries to write
+            conn: asyncpg connection
+
+        Returns:
+            Number of events written
+        """
+        if not events:
+            return 0
+
+        records = [self._event_record(e) for e in events]
+        columns = ", ".join(SAVE_COLUMNS)
+        updates = ", ".join(f"{c} = EXCLUDED.{c}" for c in SAVE_COLUMNS if c != "signature")
+
+        async with conn.transaction():
+            await conn.execute(
+                "CREATE TEMPORARY TABLE _events_staging"
+                " (LIKE venue_events INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
+            await conn.copy_records_to_table(
+                "_events_staging", records=records, columns=list(SAVE_COLUMNS)
+            )
+            await conn.execute(
+                f"INSERT INTO venue_events ({columns})"  # noqa: S608 - constant columns
+                f" SELECT {columns} FROM _events_staging"
+                f" ON CONFLICT (signature) DO UPDATE SET {updates}"
+            )
+        return len(events)
+
+    def _event_record(self, event: dict) -> tuple:
+        """Build the COPY record for one event, in SAVE_COLUMNS order."""
+        signature = self.deduper._generate_signature(event)
+        # xxh3 digests are unsigned 64-bit; shift into bigint range.
+        if signature >= 1 << 63:
+            signature -= 1 << 64
+        return (signature, *(event.get(c) for c in SAVE_COLUMNS[1:]))
 
     def normalize(self, raw_event: dict) -> dict:
         """Normalize raw event data to standard format."""
-        # TODO: Implement normalization logic
-        _ = raw_event  # Will be used when implementing
-        return {}  # Stub return
+        return {
+            **raw_event,
+            "title": (raw_event.get("title") or raw_event.get("name") or "").strip(),
+            "description": raw_event.get("description"),
+            "start_time": raw_event.get("start_time"),
+            "venue_id": raw_event.get("venue_id"),
+            "source_url": raw_event.get("source_url"),
+            "price_min": raw_event.get("price_min"),
+            "price_max": raw_event.get("price_max"),
+        }
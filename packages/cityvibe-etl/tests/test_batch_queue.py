@@ -0,0 +1,72 @@
+"""Tests for the dynamic batching queue."""
+
+import asyncio
+
+import pytest
+from cityvibe_etl.batch_queue import BatchQueue
+
+
+class TestBatchQueue:
+    """Test cases for BatchQueue."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_submits_coalesce_into_one_flush(self):
+        """Test that items submitted within the window share one backend call."""
+        batches = []
+
+        async def flush(items):
+            batches.append(items)
+            return [item * 2 for item in items]
+
+        queue = BatchQueue(flush, max_batch_size=10, max_delay_ms=20)
+
+        results = await asyncio.gather(queue.submit(1), queue.submit(2), queue.submit(3))
+
+        assert results == [2, 4, 6]
+        assert batches == [[1, 2, 3]]
+
+    @pytest.mark.asyncio
+    async def test_flushes_immediately_at_max_batch_size(self):
+        """Test that a full batch flushes without waiting for the delay."""
+        batches = []
+
+        async def flush(items):
+            batches.append(items)
+            return items
+
+        queue = BatchQueue(flush, max_batch_size=2, max_delay_ms=10_000)
+
+        results = await asyncio.gather(queue.submit("a"), queue.submit("b"))
+
+        assert results == ["a", "b"]
+        assert batches == [["a", "b"]]
+
+    @pytest.mark.asyncio
+    async def test_flush_error_propagates_to_all_waiters(self):
+        """Test that a failing backend call fails every pending submit."""
+
+        async def flush(items):
+            raise RuntimeError("backend down")
+
+        queue = BatchQueue(flush, max_batch_size=2, max_delay_ms=10_000)
+
+        results = await asyncio.gather(
+            queue.submit(1), queue.submit(2), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_wrong_length_result_fails_waiters_instead_of_hanging(self):
+        """Test that a wrong-length flush result fails every pending submit."""
+
+        async def flush(items):
+            return items[:-1]
+
+        queue = BatchQueue(flush, max_batch_size=10, max_delay_ms=20)
+
+        results = await asyncio.gather(
+            queue.submit(1), queue.submit(2), return_exceptions=True
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
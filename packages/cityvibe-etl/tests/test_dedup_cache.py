@@ -0,0 +1,30 @@
+"""Tests for the packed-slot dedup cache."""
+
+from cityvibe_etl.dedup_cache import DedupCache
+
+
+class TestDedupCache:
+    """Test cases for DedupCache."""
+
+    def test_first_check_records_signature(self):
+        """Test that an unseen signature is reported as new."""
+        cache = DedupCache()
+
+        assert cache.check_and_set(0x1234_5678_9ABC_DEF0) is False
+
+    def test_second_check_hits(self):
+        """Test that a recorded signature is reported as seen."""
+        cache = DedupCache()
+        signature = 0x1234_5678_9ABC_DEF0
+
+        cache.check_and_set(signature)
+
+        assert cache.check_and_set(signature) is True
+
+    def test_distinct_signatures_do_not_collide(self):
+        """Test that different signatures land in independent slots."""
+        cache = DedupCache()
+
+        assert cache.check_and_set(0x1111_1111_1111_1111) is False
+        assert cache.check_and_set(0x2222_2222_2222_2222) is False
+        assert cache.check_and_set(0x1111_1111_1111_1111) is True
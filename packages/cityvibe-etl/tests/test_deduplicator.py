@@ -0,0 +1,108 @@
+"""Tests for event deduplication."""
+
+import pytest
+from cityvibe_etl.deduplicator import EventDeduplicator
+
+
+class TestEventDeduplicator:
+    """Test cases for EventDeduplicator."""
+
+    @pytest.fixture
+    def deduper(self):
+        """Create a deduplicator instance."""
+        return EventDeduplicator()
+
+    @pytest.mark.asyncio
+    async def test_deduplicate_empty_batch(self, deduper):
+        """Test that deduplicate handles an empty batch."""
+        assert await deduper.deduplicate([]) == []
+
+    @pytest.mark.asyncio
+    async def test_deduplicate_keeps_distinct_events(self, deduper):
+        """Test that clearly different events are all kept."""
+        events = [
+            {"title": "Amsterdam Light Festival", "start_time": "2024-12-01T18:00:00"},
+            {"title": "Jazz at the Bimhuis", "start_time": "2024-12-01T20:00:00"},
+            {"title": "Van Gogh Museum Late Night", "start_time": "2024-12-02T19:00:00"},
+        ]
+
+        result = await deduper.deduplicate(events)
+
+        assert len(result) == 3
+
+    @pytest.mark.asyncio
+    async def test_deduplicate_removes_fuzzy_duplicates(self, deduper):
+        """Test that near-identical titles within the time window are merged."""
+        events = [
+            {"title": "Amsterdam Light Festival", "start_time": "2024-12-01T18:00:00"},
+            {"title": "Amsterdam Light Festival!", "start_time": "2024-12-01T18:30:00"},
+            {"title": "Jazz at the Bimhuis", "start_time": "2024-12-01T20:00:00"},
+        ]
+
+        result = await deduper.deduplicate(events)
+
+        assert len(result) == 2
+        assert result[0]["title"] == "Amsterdam Light Festival"
+        assert result[1]["title"] == "Jazz at the Bimhuis"
+
+    @pytest.mark.asyncio
+    async def test_deduplicate_keeps_same_title_outside_time_window(self, deduper):
+        """Test that recurring events on different days are not merged."""
+        events = [
+            {"title": "Amsterdam Light Festival", "start_time": "2024-12-01T18:00:00"},
+            {"title": "Amsterdam Light Festival", "start_time": "2024-12-02T18:00:00"},
+        ]
+
+        result = await deduper.deduplicate(events)
+
+        assert len(result) == 2
+
+    @pytest.mark.asyncio
+    async def test_deduplicate_keeps_same_title_at_different_venues(self, deduper):
+        """Test that the same film at two venues is not merged."""
+        events = [
+            {
+                "title": "The Matrix",
+                "start_time": "2024-12-03T20:00:00",
+                "venue_id": "venue-1",
+            },
+            {
+                "title": "The Matrix",
+                "start_time": "2024-12-03T20:00:00",
+                "venue_id": "venue-2",
+            },
+        ]
+
+        result = await deduper.deduplicate(events)
+
+        assert len(result) == 2
+
+    @pytest.mark.asyncio
+    async def test_deduplicate_removes_exact_duplicates_by_signature(self, deduper):
+        """Test that events with identical normalized fields collapse to one."""
+        events = [
+            {"title": "The Matrix", "start_time": "2024-12-03T20:00:00", "venue_id": "v1"},
+            {"title": "the matrix ", "start_time": "2024-12-03T20:00:00", "venue_id": "v1"},
+        ]
+
+        result = await deduper.deduplicate(events)
+
+        assert len(result) == 1
+
+    def test_generate_signature_normalizes_title(self, deduper):
+        """Test that signatures are stable under case/whitespace differences."""
+        event1 = {"title": "The Matrix", "start_time": "2024-12-03T20:00:00", "venue_id": "v1"}
+        event2 = {"title": "  THE MATRIX ", "start_time": "2024-12-03T20:00:00", "venue_id": "v1"}
+        event3 = {"title": "The Matrix", "start_time": "2024-12-03T20:00:00", "venue_id": "v2"}
+
+        assert deduper._generate_signature(event1) == deduper._generate_signature(event2)
+        assert deduper._generate_signature(event1) != deduper._generate_signature(event3)
+
+    def test_fuzzy_match_fallback(self, deduper):
+        """Test the per-pair fuzzy match fallback."""
+        event1 = {"title": "The Matrix", "start_time": "2024-12-03T20:00:00"}
+        event2 = {"title": "The Matrix ", "start_time": "2024-12-03T20:15:00"}
+        event3 = {"title": "Inception", "start_time": "2024-12-03T20:00:00"}
+
+        assert deduper._fuzzy_match(event1, event2) is True
+        assert deduper._fuzzy_match(event1, event3) is False
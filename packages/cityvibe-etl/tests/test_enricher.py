@@ -0,0 +1,209 @@
+"""Tests for event enrichment."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from cityvibe_etl.enricher import EventEnricher
+
+
+def make_enricher(handler) -> EventEnricher:
+    """Create an enricher whose HTTP client uses a mock transport."""
+    enricher = EventEnricher()
+    enricher._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return enricher
+
+
+class TestEventEnricher:
+    """Test cases for EventEnricher."""
+
+    @pytest.mark.asyncio
+    async def test_geocode_returns_coordinates(self):
+        """Test that geocode parses lat/lng from the geocoder response."""
+
+        def handler(request):
+            return httpx.Response(
+                200, content=json.dumps([{"lat": "52.3791", "lon": "4.9003"}])
+            )
+
+        enricher = make_enricher(handler)
+        try:
+            coords = await enricher.geocode("Damrak 1, Amsterdam")
+            assert coords == (52.3791, 4.9003)
+        finally:
+            await enricher.aclose()
+
+    @pytest.mark.asyncio
+    async def test_geocode_returns_none_for_unknown_address(self):
+        """Test that geocode returns None when the geocoder has no match."""
+
+        def handler(request):
+            return httpx.Response(200, content=b"[]")
+
+        enricher = make_enricher(handler)
+        try:
+            assert await enricher.geocode("Nowhere 999") is None
+        finally:
+            await enricher.aclose()
+
+    @pytest.mark.asyncio
+    async def test_geocode_failure_is_non_fatal_and_uncached(self):
+        """Test that a geocoder error yields None and is retried later."""
+        calls = 0
+
+        def handler(request):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                return httpx.Response(500)
+            return httpx.Response(
+                200, content=json.dumps([{"lat": "52.3791", "lon": "4.9003"}])
+            )
+
+        enricher = make_enricher(handler)
+        try:
+            events = [{"title": "With address", "address": "Damrak 1, Amsterdam"}]
+
+            # The failing lookup leaves the event untouched instead of raising.
+            result = await enricher.enrich(events)
+            assert "latitude" not in result[0]
+
+            # The failure was not cached, so the retry resolves.
+            assert await enricher.geocode("Damrak 1, Amsterdam") == (52.3791, 4.9003)
+        finally:
+            await enricher.aclose()
+
+    @pytest.mark.asyncio
+    async def test_geocode_malformed_payload_is_non_fatal(self):
+        """Test that a non-JSON or lat/lon-less response yields None."""
+
+        def handler(request):
+            if b"Damrak" in request.url.query:
+                return httpx.Response(200, content=b"<html>rate limited</html>")
+            return httpx.Response(200, content=json.dumps([{"display_name": "x"}]))
+
+        enricher = make_enricher(handler)
+        try:
+            assert await enricher.geocode("Damrak 1, Amsterdam") is None
+            assert await enricher.geocode("Rokin 1, Amsterdam") is None
+        finally:
+            await enricher.aclose()
+
+    @pytest.mark.asyncio
+    async def test_geocode_caches_repeated_addresses(self):
+        """Test that repeated lookups of the same address hit the cache."""
+        calls = 0
+
+        def handler(request):
+            nonlocal calls
+            calls += 1
+            return httpx.Response(
+                200, content=json.dumps([{"lat": "52.3791", "lon": "4.9003"}])
+            )
+
+        enricher = make_enricher(handler)
+        try:
+            first = await enricher.geocode("Damrak 1, Amsterdam")
+            second = await enricher.geocode("  damrak 1,  amsterdam ")
+
+            assert first == second == (52.3791, 4.9003)
+            assert calls == 1
+        finally:
+            await enricher.aclose()
+
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_preserves_input_order(self):
+        """Test that length-bucketed batching returns embeddings in input order."""
+        enricher = EventEnricher(embed_batch_size=2)
+
+        async def fake_embed(texts):
+            return [[float(len(t))] for t in texts]
+
+        enricher._embed_texts = fake_embed
+        try:
+            events = [
+                {"title": "A much much longer event title"},
+                {"title": "Tiny"},
+                {"title": "Medium length"},
+            ]
+
+            embeddings = await enricher.generate_embeddings(events)
+
+            assert embeddings == [[30.0], [4.0], [13.0]]
+        finally:
+            await enricher.aclose()
+
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_falls_back_per_text_on_memory_error(self):
+        """Test that an OOM batch is retried one text at a time."""
+        enricher = EventEnricher(embed_batch_size=4)
+        calls = []
+
+        async def fake_embed(texts):
+            calls.append(len(texts))
+            if len(texts) > 1:
+                raise MemoryError("batch too large")
+            return [[1.0] for _ in texts]
+
+        enricher._embed_texts = fake_embed
+        try:
+            events = [{"title": f"Event {i}"} for i in range(3)]
+
+            embeddings = await enricher.generate_embeddings(events)
+
+            assert embeddings == [[1.0], [1.0], [1.0]]
+            assert calls == [3, 1, 1, 1]
+        finally:
+            await enricher.aclose()
+
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_surfaces_preparation_failure(self):
+        """Test that a failing batch preparation raises instead of hanging."""
+        enricher = EventEnricher(embed_batch_size=2)
+
+        def broken_prepare(texts):
+            raise FileNotFoundError("model file missing")
+
+        enricher._prepare_batch = broken_prepare
+        try:
+            with pytest.raises(FileNotFoundError):
+                await asyncio.wait_for(
+                    enricher.generate_embeddings([{"title": "Event A"}]), timeout=2
+                )
+        finally:
+            await enricher.aclose()
+
+    def test_slice_batches_respects_char_budget(self):
+        """Test that long texts shrink the batch below the item cap."""
+        enricher = EventEnricher(embed_batch_size=4, max_embed_chars=10)
+
+        batches = enricher._slice_batches(["aaaa", "bbbb", "cccc", "dd"])
+
+        assert batches == [["aaaa", "bbbb"], ["cccc", "dd"]]
+
+    @pytest.mark.asyncio
+    async def test_enrich_geocodes_events_with_address(self):
+        """Test that enrich fills in coordinates for address-bearing events."""
+
+        def handler(request):
+            return httpx.Response(
+                200, content=json.dumps([{"lat": "52.3791", "lon": "4.9003"}])
+            )
+
+        enricher = make_enricher(handler)
+        try:
+            events = [
+                {"title": "With address", "address": "Damrak 1, Amsterdam"},
+                {"title": "Already geocoded", "address": "Damrak 2", "latitude": 1.0},
+                {"title": "No address"},
+            ]
+
+            result = await enricher.enrich(events)
+
+            assert result[0]["latitude"] == 52.3791
+            assert result[0]["longitude"] == 4.9003
+            assert result[1]["latitude"] == 1.0
+            assert "latitude" not in result[2]
+        finally:
+            await enricher.aclose()
@@ -0,0 +1,148 @@
+"""Tests for the ETL event processor."""
+
+import pytest
+from cityvibe_etl.event_processor import EventProcessor
+
+
+class TestEventProcessor:
+    """Test cases for EventProcessor."""
+
+    @pytest.fixture
+    async def processor(self):
+        """Create a processor and release its resources afterwards."""
+        processor = EventProcessor()
+        yield processor
+        await processor.aclose()
+
+    @pytest.mark.asyncio
+    async def test_process_reports_counts(self, processor):
+        """Test that process returns the documented result counts."""
+        raw_events = [
+            {
+                "title": "Event A",
+                "start_time": "2024-12-01T18:00:00",
+                "venue_id": "v1",
+                "source_url": "https://example.com/a",
+            },
+            {
+                "title": "Event B",
+                "start_time": "2024-12-01T20:00:00",
+                "venue_id": "v1",
+                "source_url": "https://example.com/b",
+            },
+        ]
+
+        result = await processor.process(raw_events)
+
+        assert result["events_processed"] == 2
+        assert result["events_new"] == 2
+        assert result["events_skipped"] == 0
+        assert result["errors"] == []
+
+    @pytest.mark.asyncio
+    async def test_process_skips_events_seen_in_earlier_batches(self, processor):
+        """Test that the dedup cache suppresses repeats across batches."""
+        raw_events = [
+            {
+                "title": "Event A",
+                "start_time": "2024-12-01T18:00:00",
+                "venue_id": "v1",
+                "source_url": "https://example.com/a",
+            },
+        ]
+
+        first = await processor.process(raw_events)
+        second = await processor.process(raw_events)
+
+        assert first["events_new"] == 1
+        assert second["events_new"] == 0
+        assert second["events_skipped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_process_handles_mixed_shape_scraper_fields(self, processor):
+        """Test that nested fields with differing shapes do not break validation."""
+        raw_events = [
+            {
+                "title": "Event A",
+                "start_time": "2024-12-01T18:00:00",
+                "venue_id": "v1",
+                "source_url": "https://example.com/a",
+                # Iamsterdam location pages emit `dates` as either a list
+                # (closedDates) or a dict (businessHours).
+                "dates": ["2024-12-25"],
+            },
+            {
+                "title": "Event B",
+                "start_time": "2024-12-01T20:00:00",
+                "venue_id": "v1",
+                "source_url": "https://example.com/b",
+                "dates": {"monday": "10:00-18:00"},
+            },
+        ]
+
+        result = await processor.process(raw_events)
+
+        assert result["events_new"] == 2
+        assert result["errors"] == []
+
+    @pytest.mark.asyncio
+    async def test_process_reports_chunk_failures_as_errors(self, processor):
+        """Test that a failing stage lands in errors instead of raising."""
+
+        async def broken_enrich(events):
+            raise RuntimeError("enrichment backend down")
+
+        processor.enricher.enrich = broken_enrich
+        raw_events = [
+            {
+                "title": "Event A",
+                "start_time": "2024-12-01T18:00:00",
+                "venue_id": "v1",
+                "source_url": "https://example.com/a",
+            },
+        ]
+
+        result = await processor.process(raw_events)
+
+        assert result["events_new"] == 0
+        assert result["events_skipped"] == 1
+        assert len(result["errors"]) == 1
+        assert "enrichment backend down" in result["errors"][0]
+
+    @pytest.mark.asyncio
+    async def test_event_record_fits_bigint_signature(self, processor):
+        """Test that COPY records carry a signed 64-bit signature."""
+        event = {
+            "title": "Event A",
+            "start_time": "2024-12-01T18:00:00",
+            "venue_id": "v1",
+            "source_url": "https://example.com/a",
+        }
+
+        record = processor._event_record(event)
+
+        assert -(1 << 63) <= record[0] < 1 << 63
+        assert record[1] == "Event A"
+
+    @pytest.mark.asyncio
+    async def test_process_splits_large_batches_into_chunks(self):
+        """Test that chunked processing aggregates counts correctly."""
+        processor = EventProcessor(chunk_size=2)
+        try:
+            raw_events = [
+                {
+                    "title": f"Event {i}",
+                    "start_time": f"2024-12-01T{10 + i}:00:00",
+                    "venue_id": "v1",
+                    "source_url": f"https://example.com/{i}",
+                }
+                for i in range(5)
+            ]
+
+            result = await processor.process(raw_events)
+
+            assert result["events_processed"] == 5
+            assert result["events_new"] == 5
+            assert result["events_skipped"] == 0
+        finally:
+            await processor.aclose()
@@ -0,0 +1,78 @@
+"""Tests for event validation."""
+
+import pyarrow as pa
+import pytest
+from cityvibe_etl.validator import EventValidator
+
+
+def make_event(**overrides) -> dict:
+    """Build a valid event, optionally overriding fields."""
+    event = {
+        "title": "Amsterdam Light Festival",
+        "start_time": "2024-12-01T18:00:00",
+        "venue_id": "venue-1",
+        "source_url": "https://example.com/events/light-festival",
+        "price_min": None,
+        "price_max": None,
+    }
+    event.update(overrides)
+    return event
+
+
+class TestEventValidator:
+    """Test cases for EventValidator."""
+
+    @pytest.fixture
+    def validator(self):
+        """Create a validator instance."""
+        return EventValidator()
+
+    def test_validate_accepts_complete_event(self, validator):
+        """Test that an event with all required fields passes."""
+        assert validator.validate(make_event()) is True
+
+    @pytest.mark.parametrize("field", ["title", "start_time", "venue_id", "source_url"])
+    def test_validate_rejects_missing_required_field(self, validator, field):
+        """Test that events missing a required field are rejected."""
+        assert validator.validate(make_event(**{field: None})) is False
+        assert validator.validate(make_event(**{field: "  "})) is False
+
+    def test_validate_rejects_malformed_url(self, validator):
+        """Test that a non-HTTP source_url is rejected."""
+        assert validator.validate(make_event(source_url="ftp://example.com")) is False
+
+    def test_validate_rejects_inverted_price_range(self, validator):
+        """Test that price_min above price_max is rejected."""
+        assert validator.validate(make_event(price_min=20.0, price_max=10.0)) is False
+        assert validator.validate(make_event(price_min=10.0, price_max=20.0)) is True
+
+    def test_validate_table_filters_invalid_rows(self, validator):
+        """Test that the vectorized path keeps only valid rows."""
+        tbl = pa.Table.from_pylist(
+            [
+                make_event(),
+                make_event(title=None),
+                make_event(source_url="not-a-url"),
+                make_event(price_min=30.0, price_max=5.0),
+            ]
+        )
+
+        valid = validator.validate_table(tbl)
+
+        assert len(valid) == 1
+        assert valid["title"][0].as_py() == "Amsterdam Light Festival"
+
+    def test_validate_table_matches_scalar_validate(self, validator):
+        """Test that the table path agrees with the scalar predicate."""
+        events = [
+            make_event(),
+            make_event(venue_id=None),
+            make_event(price_min=5.0),
+        ]
+
+        tbl_result = validator.validate_table(pa.Table.from_pylist(events)).to_pylist()
+        scalar_result = validator.validate_batch(events)
+
+        assert [e["source_url"] for e in tbl_result] == [
+            e["source_url"] for e in scalar_result
+        ]
@@ -1,5 +1,7 @@
 """Base scraper class with common functionality."""
 
+from collections.abc import AsyncIterator
+
 from cityvibe_core.models.venue import VenueBase
 
 
@@ -44,6 +46,21 @@ class BaseScraper:
         """
         raise NotImplementedError("Subclasses must implement scrape()")
 
+    async def scrape_iter(self) -> AsyncIterator[dict]:
+        """
+        Yield raw events as they become available.
+
+        The default implementation materializes `scrape()` and replays it,
+        so every scraper supports iteration; scrapers that fetch many pages
+        should override this to yield events as pages complete, letting
+        consumers start processing before the whole scrape finishes.
+
+        Yields:
+            Raw event dictionaries, same shape as `scrape()` returns
+        """
+        for event in await self.scrape():
+            yield event
+
     async def fetch_html(self, url: str) -> str:
         """
         Fetch HTML content from a URL with rate limiting and retries.
@@ -79,9 +96,9 @@ class BaseScraper:
         Raises:
             NotImplementedError: Must be implemented by subclasses
         """
-        # TODO: Implement with BeautifulSoup4
-        # from bs4 import BeautifulSoup
-        # soup = BeautifulSoup(html, 'html.parser')
+        # TODO: Implement with selectolax
+        # from selectolax.parser import HTMLParser
+        # tree = HTMLParser(html)
         # # Extract events using selectors from venue.scraper_config
         # return events
         raise NotImplementedError("Subclasses must implement parse_html()")
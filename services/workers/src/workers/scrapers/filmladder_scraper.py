@@ -1,12 +1,46 @@
 """Filmladder scraper for extracting event data."""
 
+from typing import Final
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup, Tag
-from playwright.async_api import async_playwright
+import httpx
+from playwright.async_api import Browser, async_playwright
+from selectolax.parser import HTMLParser, Node
+
+from cityvibe_core.models.venue import VenueBase
 
 from workers.scrapers.base import BaseScraper
 
+# Server-rendered pages shorter than this are assumed to need JavaScript.
+MIN_STATIC_HTML_LENGTH = 20_000
+
+# Selector fallback tables, one entry per page-structure variant. Built once
+# at module load; the scraper matches each joined selector in a single DOM
+# traversal.
+_CINEMA_SELECTORS: Final = (
+    ".cinema",
+    ".bioscoop",
+    ".venue",
+    '[class*="cinema"]',
+    '[class*="bioscoop"]',
+    '[class*="venue"]',
+    "section.cinema",
+    "div.cinema-section",
+)
+_FILM_SELECTORS: Final = (
+    ".film",
+    ".movie",
+    ".showing",
+    ".event",
+    '[class*="film"]',
+    '[class*="movie"]',
+    '[class*="showing"]',
+)
+_VENUE_SELECTORS: Final = (".cinema-name", "h2", "h3", ".venue-name", ".name")
+_TITLE_SELECTORS: Final = (".title", "h3", "h4", ".film-title", ".movie-title", "a")
+_TIME_SELECTORS: Final = (".time", ".showtime", "time", ".start-time", "[datetime]")
+_DESC_SELECTORS: Final = (".description", ".synopsis", ".summary", ".film-description")
+
 
 class FilmladderScraper(BaseScraper):
     """
@@ -14,8 +48,38 @@ class FilmladderScraper(BaseScraper):
 
     Filmladder is a Dutch cinema listing website. This scraper extracts
     film showtimes and event information from the Amsterdam cinemas page.
+
+    Parsing runs on `selectolax.parser.HTMLParser` (a C parser) instead of
+    BeautifulSoup with the pure-Python html.parser, and the alternative
+    selector patterns for each element are combined into one comma-separated
+    CSS selector, so matching is a single DOM traversal instead of one
+    traversal per fallback selector.
     """
 
+    # Comma-combined selector fallbacks, precompiled at module load.
+    CINEMA_CSS: Final = ",".join(_CINEMA_SELECTORS)
+    FILM_CSS: Final = ",".join(_FILM_SELECTORS)
+    VENUE_CSS: Final = ",".join(_VENUE_SELECTORS)
+    TITLE_CSS: Final = ",".join(_TITLE_SELECTORS)
+    TIME_CSS: Final = ",".join(_TIME_SELECTORS)
+    DESC_CSS: Final = ",".join(_DESC_SELECTORS)
+
+    def __init__(self, venue: VenueBase):
+        super().__init__(venue)
+        self._http = httpx.AsyncClient(timeout=15.0, follow_redirects=True)
+        self._playwright = None
+        self._browser: Browser | None = None
+
+    async def aclose(self) -> None:
+        """Close the HTTP client and any launched browser."""
+        await self._http.aclose()
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
     async def scrape(self) -> list[dict]:
         """
         Extract events from Filmladder.
@@ -31,18 +95,44 @@ class FilmladderScraper(BaseScraper):
         """
         url = self.venue.website_url
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-
-            try:
-                await page.goto(url, wait_until="networkidle", timeout=30000)
-                html = await page.content()
-                events = await self._parse_html(html, url)
-            finally:
-                await browser.close()
+        # Fast path: a plain HTTP fetch takes ~100ms where a full browser
+        # render costs seconds; only fall back to Playwright when the
+        # response doesn't look like usable server-rendered HTML.
+        html = await self._fetch_static(url)
+        if html is None:
+            html = await self._fetch_rendered(url)
+
+        return await self._parse_html(html, url)
+
+    async def _fetch_static(self, url: str) -> str | None:
+        """Fetch the page over plain HTTP; None when JS rendering is needed."""
+        try:
+            response = await self._http.get(url)
+            response.raise_for_status()
+        except httpx.HTTPError:
+            return None
 
-        return events
+        html = response.text
+        if len(html) < MIN_STATIC_HTML_LENGTH or "<div" not in html:
+            return None
+        return html
+
+    async def _fetch_rendered(self, url: str) -> str:
+        """Render the page with Playwright, reusing one browser per scraper."""
+        browser = await self._ensure_browser()
+        page = await browser.new_page()
+        try:
+            await page.goto(url, wait_until="networkidle", timeout=30000)
+            return await page.content()
+        finally:
+            await page.close()
+
+    async def _ensure_browser(self) -> Browser:
+        """Launch Chromium once and keep it for subsequent scrapes."""
+        if self._browser is None:
+            self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(headless=True)
+        return self._browser
 
     async def _parse_html(self, html: str, base_url: str) -> list[dict]:
         """
@@ -58,96 +148,57 @@ class FilmladderScraper(BaseScraper):
         if not html or not html.strip():
             return []
 
-        soup = BeautifulSoup(html, "html.parser")
+        tree = HTMLParser(html)
         events = []
 
-        # Try multiple selector patterns to handle different page structures
         # Pattern 1: Cinema sections with films listed underneath (most common)
-        cinema_selectors = [
-            ".cinema",
-            ".bioscoop",
-            ".venue",
-            '[class*="cinema"]',
-            '[class*="bioscoop"]',
-            '[class*="venue"]',
-            "section.cinema",
-            "div.cinema-section",
-        ]
-
-        film_selectors = [
-            ".film",
-            ".movie",
-            ".showing",
-            ".event",
-            '[class*="film"]',
-            '[class*="movie"]',
-            '[class*="showing"]',
-        ]
-
-        # Try to find cinema sections first
-        cinemas = None
-        for selector in cinema_selectors:
-            cinemas = soup.select(selector)
-            if cinemas:
-                break
+        cinemas = self._dedupe_nodes(tree.css(self.CINEMA_CSS))
 
         if cinemas:
             # Parse cinema-by-cinema structure
             for cinema in cinemas:
-                # Extract venue name
-                venue_name = None
-                venue_selectors = [".cinema-name", "h2", "h3", ".venue-name", ".name"]
-                for vs in venue_selectors:
-                    venue_elem = cinema.select_one(vs)
-                    if venue_elem:
-                        venue_name = venue_elem.get_text(strip=True)
-                        break
-
-                # If no venue name found, try to get it from parent or use default
+                # Extract venue name, falling back to the configured venue
+                venue_elem = cinema.css_first(self.VENUE_CSS)
+                venue_name = venue_elem.text(strip=True) if venue_elem else None
                 if not venue_name:
                     venue_name = self.venue.name or "Unknown Venue"
 
-                # Find film items within this cinema
-                film_items = None
-                for selector in film_selectors:
-                    film_items = cinema.select(selector)
-                    if film_items:
-                        break
-
-                if film_items:
-                    for item in film_items:
-                        event = self._extract_event_data(item, venue_name, base_url)
-                        if event:
-                            events.append(event)
-        else:
-            # Pattern 2: Films listed directly on the page (no cinema grouping)
-            # Try all selectors and combine results (items might use different classes)
-            all_film_items = []
-            seen_items = set()
-            for selector in film_selectors:
-                found_items = soup.select(selector)
-                for item in found_items:
-                    # Use id to deduplicate if same element found by multiple selectors
-                    item_id = id(item)
-                    if item_id not in seen_items:
-                        seen_items.add(item_id)
-                        all_film_items.append(item)
-
-            if all_film_items:
-                venue_name = self.venue.name or "Unknown Venue"
-                for item in all_film_items:
+                for item in self._dedupe_nodes(cinema.css(self.FILM_CSS)):
                     event = self._extract_event_data(item, venue_name, base_url)
                     if event:
                         events.append(event)
+        else:
+            # Pattern 2: Films listed directly on the page (no cinema grouping)
+            venue_name = self.venue.name or "Unknown Venue"
+            for item in self._dedupe_nodes(tree.css(self.FILM_CSS)):
+                event = self._extract_event_data(item, venue_name, base_url)
+                if event:
+                    events.append(event)
 
         return events
 
-    def _extract_event_data(self, item: Tag, venue_name: str, base_url: str) -> dict | None:
+    @staticmethod
+    def _dedupe_nodes(nodes: list[Node]) -> list[Node]:
+        """
+        Deduplicate nodes matched by a comma selector.
+
+        selectolax yields a node once per matching alternative, so the same
+        element can appear multiple times; keep the first occurrence.
+        """
+        seen: set[int] = set()
+        unique = []
+        for node in nodes:
+            if node.mem_id not in seen:
+                seen.add(node.mem_id)
+                unique.append(node)
+        return unique
+
+    def _extract_event_data(self, item: Node, venue_name: str, base_url: str) -> dict | None:
         """
         Extract event data from a single film/item element.
 
         Args:
-            item: BeautifulSoup element containing film/showing information
+            item: Parsed element containing film/showing information
             venue_name: Name of the venue/cinema
             base_url: Base URL for constructing absolute links
 
@@ -155,49 +206,28 @@ class FilmladderScraper(BaseScraper):
             Dictionary with event data or None if extraction fails
         """
         # Extract title
-        title = None
-        title_selectors = [".title", "h3", "h4", ".film-title", ".movie-title", "a"]
-        for ts in title_selectors:
-            title_elem = item.select_one(ts)
-            if title_elem:
-                title = title_elem.get_text(strip=True)
-                # If it's a link, prefer the link text
-                if title_elem.name == "a" and title:
-                    break
-                if title:
-                    break
-
+        title_elem = item.css_first(self.TITLE_CSS)
+        title = title_elem.text(strip=True) if title_elem else None
         if not title:
             return None
 
-        # Extract start time/showtime
+        # Extract start time/showtime, preferring the datetime attribute
         start_time = None
-        time_selectors = [".time", ".showtime", "time", ".start-time", "[datetime]"]
-        for ts in time_selectors:
-            time_elem = item.select_one(ts)
-            if time_elem:
-                # Try datetime attribute first
-                start_time = time_elem.get("datetime") or time_elem.get_text(strip=True)
-                if start_time:
-                    break
+        time_elem = item.css_first(self.TIME_CSS)
+        if time_elem:
+            start_time = time_elem.attributes.get("datetime") or time_elem.text(strip=True)
 
         # Extract source URL
         source_url = None
-        link_elem = item.select_one("a[href]")
+        link_elem = item.css_first("a[href]")
         if link_elem:
-            href = link_elem.get("href", "")
-            if href and isinstance(href, str):
+            href = link_elem.attributes.get("href") or ""
+            if href:
                 source_url = urljoin(base_url, href) if not href.startswith("http") else href
 
         # Extract description
-        description = None
-        desc_selectors = [".description", ".synopsis", ".summary", ".film-description"]
-        for ds in desc_selectors:
-            desc_elem = item.select_one(ds)
-            if desc_elem:
-                description = desc_elem.get_text(strip=True)
-                if description:
-                    break
+        desc_elem = item.css_first(self.DESC_CSS)
+        description = desc_elem.text(strip=True) if desc_elem else None
 
         return {
             "title": title,
@@ -1,15 +1,131 @@
 """Iamsterdam scraper for extracting event data."""
 
-import json
+import asyncio
+import hashlib
+import random
+import re
 import xml.etree.ElementTree as ET
-from typing import Any
+from collections.abc import AsyncIterator
 
 import httpx
-from bs4 import BeautifulSoup
 from loguru import logger
 
+try:
+    # orjson parses the multi-kilobyte __NEXT_DATA__ payloads several times
+    # faster than the stdlib and takes the raw bytes without a decode pass.
+    import orjson as _json
+except ImportError:  # pragma: no cover - orjson is a regular dependency
+    import json as _json
+
 from workers.scrapers.base import BaseScraper
 
+# The pages are Next.js renders; all data we need lives in one well-formed
+# script tag, so a regex over the raw bytes replaces a full HTML parse.
+# Built once; httpx re-sends these on every request from the shared client.
+# Brotli shaves ~25% off the wire size versus gzip on these text-heavy pages;
+# httpx decompresses it transparently via the brotli package.
+_DEFAULT_HEADERS = {
+    "Accept-Encoding": "br, gzip",
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    )
+}
+
+# Output schemas for the normalizers, built once at import time. copy() of a
+# template is a flat C-level copy that presizes the dict and fixes the key
+# order, which is cheaper than rebuilding the ~30-key literal per page; the
+# templates hold only immutable defaults so sharing them is safe.
+_LOCATION_EVENT_TEMPLATE: dict = {
+    "kind": "Location",
+    "id": None,
+    "ffID": None,
+    "slug": None,
+    "title": None,
+    "name": None,
+    "category": None,
+    "directory": None,
+    "pages": None,
+    "seo_title": None,
+    "seo_description": None,
+    "seo_slug": None,
+    "seo_og_image": None,
+    "localizations": None,
+    "intro": None,
+    "description": None,
+    "description_html": None,
+    "main_image": None,
+    "images": None,
+    "alwaysOpen": None,
+    "closedDates": None,
+    "businessHours": None,
+    "openUntil": None,
+    "soldOut": None,
+    "address": None,
+    "coordinates": None,
+    "phoneNumber": None,
+    "email": None,
+    "urls": None,
+    "promotions": None,
+    "dates": None,
+    "source_url": None,
+}
+
+_EVENT_TEMPLATE: dict = {
+    "kind": "Event",
+    "id": None,
+    "slug": None,
+    "title": None,
+    "name": None,
+    "directory": None,
+    "pages": None,
+    "seo_title": None,
+    "seo_description": None,
+    "seo_slug": None,
+    "seo_og_image": None,
+    "localizations": None,
+    "intro": None,
+    "description": None,
+    "description_html": None,
+    "main_image": None,
+    "images": None,
+    "dates": None,
+    "highlights": None,
+    "source_url": None,
+}
+
+# pageProps keys that can carry extractable event/location data; one set
+# intersection against the decoded keys short-circuits irrelevant pages.
+_RELEVANT_KEYS = frozenset({"event", "Event", "data", "Location", "location"})
+
+_SITEMAP_NS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+
+# Paths marking event/location pages (Dutch and English agenda sections),
+# and the slash count above which a URL stops being a listing page. One
+# compiled alternation scans each loc once. The count threshold matches the
+# original len(loc.split("/")) > 6 check: split length is slash count + 1.
+_AGENDA_RE = re.compile(r"/(?:uit/agenda|whats-on/calendar)/")
+_MIN_URL_SLASHES = 5
+_SITEMAP_URL_TAG = f"{{{_SITEMAP_NS}}}url"
+_SITEMAP_LOC_TAG = f"{{{_SITEMAP_NS}}}loc"
+
+_NEXT_DATA_RE = re.compile(
+    rb'<script[^>]*id="__NEXT_DATA__"[^>]*>(.*?)</script>',
+    re.DOTALL,
+)
+
+# Every page the extractor can turn into an event mentions at least one of
+# these keys; a bytes containment scan is far cheaper than a JSON decode, so
+# irrelevant pages (the majority of the sitemap) are rejected before parsing.
+_RELEVANT_MARKERS = (
+    b'"pageType"',
+    b'"event"',
+    b'"Event"',
+    b'"Location"',
+    b'"location"',
+)
+
 
 class IamsterdamScraper(BaseScraper):
     """
@@ -22,6 +138,50 @@ class IamsterdamScraper(BaseScraper):
     3. Normalizing the data into a consistent format
     """
 
+    # Upper bound on concurrent page fetches.
+    MAX_CONCURRENT_REQUESTS = 64
+
+    # Transient statuses worth retrying, and how often to try in total.
+    RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+    MAX_ATTEMPTS = 4
+    # Longest sleep a Retry-After header may impose on a single retry.
+    MAX_RETRY_AFTER = 30.0
+
+    def __init__(self, venue) -> None:
+        super().__init__(venue)
+        # Shared client, created lazily so construction stays cheap and the
+        # connection pool lives on the running event loop.
+        self._client: httpx.AsyncClient | None = None
+        # SHA-1 digests of page bodies seen this scrape; different URLs often
+        # render identical HTML, and hashing the bytes (hardware-accelerated
+        # on modern CPUs) is far cheaper than re-extracting and re-decoding.
+        self._seen_digests: set[bytes] = set()
+        # Last parsed sitemap plus its ETag; revalidated with If-None-Match
+        # so repeat scrapes in one process skip the download and re-parse.
+        self._sitemap_etag: str | None = None
+        self._sitemap_urls: list[str] | None = None
+
+    def _ensure_client(self) -> httpx.AsyncClient:
+        """Create the shared HTTP client on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=64,
+                    max_keepalive_connections=64,
+                    keepalive_expiry=30,
+                ),
+                timeout=httpx.Timeout(15.0, connect=10.0),
+                headers=_DEFAULT_HEADERS,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     async def scrape(self) -> list[dict]:
         """
         Extract events from Iamsterdam by discovering URLs from sitemap and scraping them.
@@ -30,37 +190,65 @@ class IamsterdamScraper(BaseScraper):
             List of raw event dictionaries. Each dict contains normalized event data
             with fields like: title, description, dates, location, images, etc.
         """
+        return [event async for event in self.scrape_iter()]
+
+    async def scrape_iter(self) -> AsyncIterator[dict]:
+        """
+        Yield events from Iamsterdam as their pages finish scraping.
+
+        Consumers downstream (dedup, ETL) can start working on the first
+        events while the bulk of the pages are still being fetched, instead
+        of waiting for the whole scrape to materialize.
+
+        Yields:
+            Raw event dictionaries, same shape as `scrape()` returns
+        """
         logger.info(f"🚀 Starting scrape for Iamsterdam: {self.venue.website_url}")
 
+        # The digest skip only deduplicates identical content within one
+        # scrape; a fresh run must re-emit pages whose bytes are unchanged.
+        self._seen_digests.clear()
+
         # Discover event URLs from sitemap
         event_urls = await self._get_sitemap_urls()
         logger.info(f"📊 Found {len(event_urls)} potential event/location URLs in sitemap")
 
         if not event_urls:
             logger.warning("⚠️ No event URLs found in sitemap")
-            return []
+            return
+
+        # Scrape pages concurrently; the semaphore bounds in-flight requests
+        # so we overlap network latency without hammering the origin.
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+
+        async def _bounded(url: str) -> dict | None:
+            async with semaphore:
+                return await self._scrape_event_page(url)
 
-        # Scrape each URL
-        results = []
-        processed_count = 0
+        # as_completed yields each page the moment its fetch finishes, so the
+        # first events flow downstream while slower pages are still loading.
+        tasks = [asyncio.ensure_future(_bounded(url)) for url in event_urls]
+        total = len(tasks)
+        processed = 0
+        scraped = 0
 
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            for url in event_urls:
-                try:
-                    event_data = await self._scrape_event_page(client, url)
-                    if event_data:
-                        results.append(event_data)
-                        processed_count += 1
+        for future in asyncio.as_completed(tasks):
+            try:
+                page = await future
+            except Exception as e:
+                logger.error(f"❌ Error scraping page: {e}")
+                page = None
 
-                    # Log progress every 50 items
-                    if processed_count % 50 == 0:
-                        logger.info(f"📝 Processed {processed_count}/{len(event_urls)} URLs...")
-                except Exception as e:
-                    logger.error(f"❌ Error scraping {url}: {e}")
-                    continue
+            processed += 1
+            # Log progress every 50 items
+            if processed % 50 == 0:
+                logger.info(f"📝 Processed {processed}/{total} URLs...")
 
-        logger.info(f"✅ Successfully scraped {len(results)} events from Iamsterdam")
-        return results
+            if page:
+                scraped += 1
+                yield page
+
+        logger.info(f"✅ Successfully scraped {scraped} events from Iamsterdam")
 
     async def _get_sitemap_urls(self) -> list[str]:
         """
@@ -73,32 +261,55 @@ class IamsterdamScraper(BaseScraper):
         logger.debug(f"🔍 Fetching sitemap from: {sitemap_url}")
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(sitemap_url)
+            client = self._ensure_client()
+
+            # Stream the (multi-megabyte) sitemap through a pull parser so we
+            # never hold the whole document in memory, and start extracting
+            # URLs while later chunks are still on the wire.
+            parser = ET.XMLPullParser(["end"])
+            # Dedupe inline while parsing; one pass, sitemap order preserved.
+            unique_urls: list[str] = []
+            seen: set[str] = set()
+
+            headers = {}
+            if self._sitemap_etag and self._sitemap_urls is not None:
+                headers["If-None-Match"] = self._sitemap_etag
+
+            async with client.stream(
+                "GET", sitemap_url, timeout=30.0, headers=headers
+            ) as response:
+                if (
+                    response.status_code == httpx.codes.NOT_MODIFIED
+                    and self._sitemap_urls is not None
+                ):
+                    logger.debug("🔁 Sitemap unchanged (304), reusing cached URLs")
+                    return self._sitemap_urls
                 response.raise_for_status()
+                async for chunk in response.aiter_bytes():
+                    parser.feed(chunk)
+                    for _, elem in parser.read_events():
+                        if elem.tag == _SITEMAP_LOC_TAG:
+                            loc = elem.text
+                            # Filter for event/location pages:
+                            # - Must be in /uit/agenda/ (Dutch) or
+                            #   /whats-on/calendar/ (English)
+                            # - Must be deep enough (exclude listing pages,
+                            #   usually 6+ segments)
+                            if (
+                                loc
+                                and loc not in seen
+                                and _AGENDA_RE.search(loc)
+                                and loc.count("/") > _MIN_URL_SLASHES
+                            ):
+                                seen.add(loc)
+                                unique_urls.append(loc)
+                        elif elem.tag == _SITEMAP_URL_TAG:
+                            # Drop processed <url> subtrees to cap memory.
+                            elem.clear()
+
+            self._sitemap_etag = response.headers.get("ETag")
+            self._sitemap_urls = unique_urls
 
-            # Parse XML sitemap
-            root = ET.fromstring(response.content)
-            namespace = {"ns": "http://www.sitemaps.org/schemas/sitemap/0.9"}
-
-            all_urls = []
-
-            for url_tag in root.findall("ns:url", namespace):
-                loc_elem = url_tag.find("ns:loc", namespace)
-                if loc_elem is not None:
-                    loc = loc_elem.text
-                    if loc is None:
-                        continue
-
-                    # Filter for event/location pages:
-                    # - Must be in /uit/agenda/ (Dutch) or /whats-on/calendar/ (English)
-                    # - Must be deep enough (exclude listing pages, usually 6+ segments)
-                    if ("/uit/agenda/" in loc or "/whats-on/calendar/" in loc) and len(
-                        loc.split("/")
-                    ) > 6:
-                        all_urls.append(loc)
-
-            unique_urls = list[Any](set[Any](all_urls))
             logger.debug(f"🔍 Found {len(unique_urls)} unique event URLs in sitemap")
             return unique_urls
 
@@ -106,46 +317,92 @@ class IamsterdamScraper(BaseScraper):
             logger.error(f"❌ Critical error parsing sitemap: {e}")
             return []
 
-    async def _scrape_event_page(self, client: httpx.AsyncClient, url: str) -> dict | None:
+    async def _get_with_retry(self, url: str) -> httpx.Response:
+        """
+        GET a URL, retrying transient failures with jittered backoff.
+
+        Retries 429/502/503/504 up to MAX_ATTEMPTS times, honouring a numeric
+        Retry-After header (capped at MAX_RETRY_AFTER) when the origin sends
+        one and otherwise backing off exponentially with jitter so concurrent
+        retries do not align.
+
+        Args:
+            url: URL to fetch
+
+        Returns:
+            The final response (possibly still a retryable status if all
+            attempts were exhausted)
+        """
+        client = self._ensure_client()
+        response = await client.get(url)
+        for attempt in range(self.MAX_ATTEMPTS - 1):
+            if response.status_code not in self.RETRY_STATUS_CODES:
+                return response
+
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                # Clamp the server-supplied delay: an aggressive Retry-After
+                # must not park a bounded-concurrency slot for minutes.
+                delay = min(float(retry_after), self.MAX_RETRY_AFTER)
+            else:
+                delay = (2**attempt) * 0.5 + random.random() * 0.25
+
+            logger.debug(
+                f"⏳ Got {response.status_code} for {url}, retrying in {delay:.2f}s"
+            )
+            await asyncio.sleep(delay)
+            response = await client.get(url)
+        return response
+
+    async def _scrape_event_page(self, url: str) -> dict | None:
         """
         Scrape a single event or location page to extract Next.js data.
 
         Args:
-            client: httpx async client for making requests
             url: URL of the event/location page to scrape
 
         Returns:
             Normalized event/location dictionary or None if extraction fails
         """
         try:
-            headers = {
-                "User-Agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-                )
-            }
-
-            response = await client.get(url, headers=headers)
+            response = await self._get_with_retry(url)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.content, "html.parser")
-            script_tag = soup.find("script", id="__NEXT_DATA__")
+            digest = hashlib.sha1(response.content).digest()
+            if digest in self._seen_digests:
+                logger.debug(f"⏭️ Duplicate page content, skipping {url}")
+                return None
+            self._seen_digests.add(digest)
 
-            if not script_tag:
+            match = _NEXT_DATA_RE.search(response.content)
+            if not match:
                 logger.debug(f"⚠️ No __NEXT_DATA__ found in {url}")
                 return None
 
-            # Get script content - use get_text() for safety
-            script_content = script_tag.get_text() if hasattr(script_tag, "get_text") else None
-            if not script_content or not script_content.strip():
+            script_content = match.group(1)
+            if not script_content.strip():
                 logger.debug(f"⚠️ Empty __NEXT_DATA__ script content in {url}")
                 return None
 
-            json_obj = json.loads(script_content)
+            if not any(marker in script_content for marker in _RELEVANT_MARKERS):
+                logger.debug(f"⚠️ No event/location markers in {url}")
+                return None
+
+            # Decode off the event loop: payloads run to hundreds of
+            # kilobytes, and with 64 fetches in flight the loop should keep
+            # scheduling I/O instead of parsing JSON.
+            json_obj = await asyncio.to_thread(_json.loads, script_content)
             page_props = json_obj.get("props", {}).get("pageProps", {}) or {}
 
             page_type = page_props.get("pageType", "Unknown")
 
+            # Bail out before the branch checks when the page neither
+            # declares a usable pageType nor carries any payload key.
+            if page_type not in ("Event", "Location") and not (
+                _RELEVANT_KEYS & page_props.keys()
+            ):
+                return None
+
             # Handle Event pages
             if page_type == "Event" or "event" in page_props or "Event" in page_props:
                 event = page_props.get("event") or page_props.get("Event") or page_props.get("data")
@@ -186,64 +443,70 @@ class IamsterdamScraper(BaseScraper):
         Returns:
             Normalized dictionary with location/visit-related fields
         """
-        seo = page_props.get("seo", {})
-        localizations = page_props.get("localizations", [])
-
-        images = loc.get("images") or []
+        # Bind the lookups once; these normalizers run for every scraped
+        # page, and repeated attribute/key resolution adds up at that volume.
+        loc_get = loc.get
+        pp_get = page_props.get
+        seo = pp_get("seo", {})
+        seo_get = seo.get
+
+        images = loc_get("images") or []
         main_image = images[0]["src"] if images else None
 
-        address = loc.get("address") or {}
-        coords = loc.get("coordinates") or {}
+        address = loc_get("address") or {}
+        coords = loc_get("coordinates") or {}
+
+        name = loc_get("name")
+        description = loc_get("description")
+        closed_dates = loc_get("closedDates")
+        business_hours = loc_get("businessHours", {})
 
         # Extract dates from business hours or closed dates if available
-        dates = None
-        if loc.get("closedDates"):
-            dates = loc.get("closedDates")
-        elif loc.get("businessHours"):
-            dates = loc.get("businessHours")
-
-        return {
-            "kind": "Location",
-            "id": loc.get("id"),
-            "ffID": loc.get("ffID"),
-            "slug": loc.get("slug"),
-            "title": loc.get("name"),
-            "name": loc.get("name"),
-            "category": loc.get("category", []),
-            "directory": page_props.get("directory"),
-            "pages": page_props.get("pages", []),
-            "seo_title": seo.get("title"),
-            "seo_description": seo.get("description"),
-            "seo_slug": seo.get("slug"),
-            "seo_og_image": seo.get("ogImage"),
-            "localizations": localizations,
-            "intro": loc.get("intro"),
-            "description": loc.get("description"),
-            "description_html": loc.get("description"),
-            "main_image": main_image,
-            "images": images,
-            "alwaysOpen": loc.get("alwaysOpen"),
-            "closedDates": loc.get("closedDates"),
-            "businessHours": loc.get("businessHours", {}),
-            "openUntil": loc.get("openUntil"),
-            "soldOut": loc.get("soldOut"),
-            "address": {
+        dates = closed_dates or business_hours or None
+
+        result = _LOCATION_EVENT_TEMPLATE.copy()
+        result.update(
+            id=loc_get("id"),
+            ffID=loc_get("ffID"),
+            slug=loc_get("slug"),
+            title=name,
+            name=name,
+            category=loc_get("category", []),
+            directory=pp_get("directory"),
+            pages=pp_get("pages", []),
+            seo_title=seo_get("title"),
+            seo_description=seo_get("description"),
+            seo_slug=seo_get("slug"),
+            seo_og_image=seo_get("ogImage"),
+            localizations=pp_get("localizations", []),
+            intro=loc_get("intro"),
+            description=description,
+            description_html=description,
+            main_image=main_image,
+            images=images,
+            alwaysOpen=loc_get("alwaysOpen"),
+            closedDates=closed_dates,
+            businessHours=business_hours,
+            openUntil=loc_get("openUntil"),
+            soldOut=loc_get("soldOut"),
+            address={
                 "street": address.get("street"),
                 "houseNumber": address.get("houseNumber"),
                 "zipcode": address.get("zipcode"),
                 "city": address.get("city"),
             },
-            "coordinates": {
+            coordinates={
                 "lat": coords.get("latitude"),
                 "lng": coords.get("longitude"),
             },
-            "phoneNumber": loc.get("phoneNumber"),
-            "email": loc.get("email"),
-            "urls": loc.get("urls", []),
-            "promotions": loc.get("promotions", []),
-            "dates": dates,
-            "source_url": url,
-        }
+            phoneNumber=loc_get("phoneNumber"),
+            email=loc_get("email"),
+            urls=loc_get("urls", []),
+            promotions=loc_get("promotions", []),
+            dates=dates,
+            source_url=url,
+        )
+        return result
 
     def _normalize_event(self, event: dict, page_props: dict, url: str) -> dict:
         """
@@ -257,34 +520,38 @@ class IamsterdamScraper(BaseScraper):
         Returns:
             Normalized dictionary with event fields
         """
-        seo = page_props.get("seo", {})
-        localizations = page_props.get("localizations", [])
+        event_get = event.get
+        pp_get = page_props.get
+        seo = pp_get("seo", {})
+        seo_get = seo.get
 
-        images = event.get("images") or []
+        images = event_get("images") or []
         main_image = images[0]["src"] if images else None
 
         # Extract title (can be in different fields)
-        title = event.get("title") or event.get("name") or seo.get("title")
-
-        return {
-            "kind": "Event",
-            "id": event.get("id"),
-            "slug": event.get("slug"),
-            "title": title,
-            "name": title,
-            "directory": page_props.get("directory"),
-            "pages": page_props.get("pages", []),
-            "seo_title": seo.get("title"),
-            "seo_description": seo.get("description"),
-            "seo_slug": seo.get("slug"),
-            "seo_og_image": seo.get("ogImage"),
-            "localizations": localizations,
-            "intro": event.get("intro"),
-            "description": event.get("description"),
-            "description_html": event.get("description"),
-            "main_image": main_image,
-            "images": images,
-            "dates": event.get("date") or event.get("dates"),
-            "highlights": event.get("highlights", []),
-            "source_url": url,
-        }
+        title = event_get("title") or event_get("name") or seo_get("title")
+        description = event_get("description")
+
+        result = _EVENT_TEMPLATE.copy()
+        result.update(
+            id=event_get("id"),
+            slug=event_get("slug"),
+            title=title,
+            name=title,
+            directory=pp_get("directory"),
+            pages=pp_get("pages", []),
+            seo_title=seo_get("title"),
+            seo_description=seo_get("description"),
+            seo_slug=seo_get("slug"),
+            seo_og_image=seo_get("ogImage"),
+            localizations=pp_get("localizations", []),
+            intro=event_get("intro"),
+            description=description,
+            description_html=description,
+            main_image=main_image,
+            images=images,
+            dates=event_get("date") or event_get("dates"),
+            highlights=event_get("highlights", []),
+            source_url=url,
+        )
+        return result
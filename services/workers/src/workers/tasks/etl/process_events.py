@@ -1,15 +1,20 @@
 """Celery task for processing raw events through the ETL pipeline."""
 
+import asyncio
+
+from cityvibe_etl.event_processor import EventProcessor
+from loguru import logger
+
 
 def process_events_task(venue_id: str, raw_events: list[dict]) -> dict:
     """
     Celery task to process raw scraped events through the ETL pipeline.
 
-    This task is a thin wrapper around the ETL processor.
-    It handles:
-    - Task execution context
-    - Error handling and retries
-    - Result reporting
+    This task is a thin wrapper around the ETL processor. The processor
+    slices the batch into ~500-event chunks and runs validation and dedup
+    on columnar data. Persistence only happens when the processor is given
+    an asyncpg pool (one COPY + upsert per chunk); this task constructs it
+    without one, so the save stage is skipped until pool wiring lands.
 
     Args:
         venue_id: UUID of the venue
@@ -18,10 +23,24 @@ def process_events_task(venue_id: str, raw_events: list[dict]) -> dict:
     Returns:
         Dictionary with processing results (events_new, events_updated, etc.)
     """
-    # TODO: Implement task logic
-    # processor = EventProcessor()
-    # result = await processor.process(raw_events)
-    # return result.to_dict()
-    _ = venue_id  # Will be used when implementing
-    _ = raw_events  # Will be used when implementing
-    return {}  # Stub return
+    logger.info(f"🚀 Processing {len(raw_events)} raw events for venue {venue_id}")
+
+    # Scrapers do not know their venue's UUID; stamp it here so dedup
+    # signatures and the saved rows carry it.
+    events = [{**event, "venue_id": event.get("venue_id") or venue_id} for event in raw_events]
+
+    result = asyncio.run(_process(events))
+    logger.info(
+        f"✅ Processed {result['events_processed']} events for venue {venue_id}: "
+        f"{result['events_new']} new, {result['events_skipped']} skipped"
+    )
+    return result
+
+
+async def _process(events: list[dict]) -> dict:
+    """Run one batch through a fresh processor, releasing its resources."""
+    processor = EventProcessor()
+    try:
+        return await processor.process(events)
+    finally:
+        await processor.aclose()
@@ -1,87 +1,145 @@
 """Tests for Iamsterdam scraper."""
 
-import json
-from unittest.mock import AsyncMock, MagicMock, patch
-
+import httpx
+import orjson
 import pytest
 from cityvibe_core.models.venue import VenueBase
 from httpx import Response
 from workers.scrapers.iamsterdam_scraper import IamsterdamScraper
 
 
+# Fixture bodies as module-level bytes, built once at import time instead of
+# re-encoded inside every test.
+_SITEMAP_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+    <url>
+        <loc>https://www.iamsterdam.com/en/see-and-do/whats-on/calendar/event-1</loc>
+    </url>
+    <url>
+        <loc>https://www.iamsterdam.com/en/see-and-do/whats-on/calendar/event-2</loc>
+    </url>
+    <url>
+        <loc>https://www.iamsterdam.com/nl/uit/agenda/dutch-event</loc>
+    </url>
+    <url>
+        <loc>https://www.iamsterdam.com/en/see-and-do/whats-on/calendar</loc>
+    </url>
+    <url>
+        <loc>https://www.iamsterdam.com/en/other-page</loc>
+    </url>
+</urlset>"""
+
+_EMPTY_SITEMAP_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+</urlset>"""
+
+_SINGLE_URL_SITEMAP_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+    <url>
+        <loc>https://www.iamsterdam.com/en/see-and-do/whats-on/calendar/event-1</loc>
+    </url>
+</urlset>"""
+
+_NO_NEXT_DATA_HTML = b"<html><body><h1>No Next.js data here</h1></body></html>"
+
+
+def _page_html(next_data: dict) -> bytes:
+    """Render a Next.js page body embedding the given __NEXT_DATA__ payload.
+
+    orjson.dumps returns bytes directly, so the fixture skips both the
+    stdlib serializer and the str.encode round-trip.
+    """
+    return (
+        b'<html><body><script id="__NEXT_DATA__" type="application/json">'
+        + orjson.dumps(next_data)
+        + b"</script></body></html>"
+    )
+
+
+@pytest.fixture(scope="module")
+def venue():
+    """Create a test venue, shared across the module's tests."""
+    return VenueBase(
+        name="Iamsterdam",
+        website_url="https://www.iamsterdam.com/en/see-and-do/whats-on/events",
+        city="Amsterdam",
+        country="NL",
+    )
+
+
+@pytest.fixture(scope="module")
+def scraper(venue):
+    """Create one scraper instance for the module; tests inject their own client."""
+    return IamsterdamScraper(venue)
+
+
 class TestIamsterdamScraper:
     """Test cases for IamsterdamScraper."""
 
-    @pytest.fixture
-    def venue(self):
-        """Create a test venue."""
-        return VenueBase(
-            name="Iamsterdam",
-            website_url="https://www.iamsterdam.com/en/see-and-do/whats-on/events",
-            city="Amsterdam",
-            country="NL",
-        )
+    @staticmethod
+    def _mock_sitemap_client(sitemap_xml: bytes) -> httpx.AsyncClient:
+        """Build a real client whose transport serves the given sitemap."""
+
+        def handler(request):
+            return Response(status_code=200, content=sitemap_xml)
+
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
 
-    @pytest.fixture
-    def scraper(self, venue):
-        """Create a scraper instance."""
-        return IamsterdamScraper(venue)
+    @staticmethod
+    def _mock_page_client(content: bytes) -> httpx.AsyncClient:
+        """Build a real client whose transport serves the given page body."""
+
+        def handler(request):
+            return Response(status_code=200, content=content)
+
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
 
     @pytest.mark.asyncio
     async def test_get_sitemap_urls_filters_event_urls(self, scraper):
         """Test that _get_sitemap_urls filters for event/location URLs."""
-        sitemap_xml = """<?xml version="1.0" encoding="UTF-8"?>
-        <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
-            <url>
-                <loc>https://www.iamsterdam.com/en/see-and-do/whats-on/calendar/event-1</loc>
-            </url>
-            <url>
-                <loc>https://www.iamsterdam.com/en/see-and-do/whats-on/calendar/event-2</loc>
-            </url>
-            <url>
-                <loc>https://www.iamsterdam.com/en/see-and-do/whats-on/calendar</loc>
-            </url>
-            <url>
-                <loc>https://www.iamsterdam.com/en/other-page</loc>
-            </url>
-        </urlset>"""
-
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_response = Response(
-                status_code=200,
-                content=sitemap_xml.encode(),
-                request=MagicMock(),
-            )
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
+        scraper._client = self._mock_sitemap_client(_SITEMAP_XML)
 
-            urls = await scraper._get_sitemap_urls()
+        urls = await scraper._get_sitemap_urls()
 
-            # Should only include deep event URLs, not listing pages or other pages
-            assert len(urls) == 2
-            assert "event-1" in urls[0] or "event-1" in urls[1]
-            assert "event-2" in urls[0] or "event-2" in urls[1]
+        # Should only include deep event URLs (including the shallower Dutch
+        # /uit/agenda/ form), not listing pages or other pages
+        assert len(urls) == 3
+        assert any("event-1" in url for url in urls)
+        assert any("event-2" in url for url in urls)
+        assert any("dutch-event" in url for url in urls)
 
     @pytest.mark.asyncio
     async def test_get_sitemap_urls_handles_empty_sitemap(self, scraper):
         """Test that _get_sitemap_urls handles empty sitemap gracefully."""
-        sitemap_xml = """<?xml version="1.0" encoding="UTF-8"?>
-        <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
-        </urlset>"""
+        scraper._client = self._mock_sitemap_client(_EMPTY_SITEMAP_XML)
+
+        urls = await scraper._get_sitemap_urls()
+        assert urls == []
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_response = Response(
+    @pytest.mark.asyncio
+    async def test_get_sitemap_urls_reuses_cache_on_304(self, scraper):
+        """Test that an unchanged sitemap (304) returns the cached URL list."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if request.headers.get("If-None-Match") == '"abc123"':
+                return Response(status_code=304)
+            return Response(
                 status_code=200,
-                content=sitemap_xml.encode(),
-                request=MagicMock(),
-            )
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
+                content=_SINGLE_URL_SITEMAP_XML,
+                headers={"ETag": '"abc123"'},
             )
 
-            urls = await scraper._get_sitemap_urls()
-            assert urls == []
+        scraper._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        first = await scraper._get_sitemap_urls()
+        second = await scraper._get_sitemap_urls()
+
+        assert first
+        assert second == first
+        # The revalidation request carried the stored ETag.
+        assert requests[1].headers["If-None-Match"] == '"abc123"'
 
     @pytest.mark.asyncio
     async def test_scrape_event_page_extracts_event_data(self, scraper):
@@ -103,34 +161,20 @@ class TestIamsterdamScraper:
             }
         }
 
-        html = f'<html><body><script id="__NEXT_DATA__" type="application/json">{json.dumps(next_data)}</script></body></html>'
+        scraper._client = self._mock_page_client(_page_html(next_data))
 
-        mock_response = Response(
-            status_code=200,
-            content=html.encode(),
-            request=MagicMock(),
+        result = await scraper._scrape_event_page(
+            "https://www.iamsterdam.com/en/events/amsterdam-light-festival"
         )
 
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get = AsyncMock(return_value=mock_response)
-        mock_client = MagicMock()
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
-
-        with patch("httpx.AsyncClient", return_value=mock_client):
-            result = await scraper._scrape_event_page(
-                mock_client_instance,
-                "https://www.iamsterdam.com/en/events/amsterdam-light-festival",
-            )
-
-            assert result is not None
-            assert result["kind"] == "Event"
-            assert result["title"] == "Amsterdam Light Festival"
-            assert result["description"] == "Annual light art festival"
-            assert (
-                result["source_url"]
-                == "https://www.iamsterdam.com/en/events/amsterdam-light-festival"
-            )
+        assert result is not None
+        assert result["kind"] == "Event"
+        assert result["title"] == "Amsterdam Light Festival"
+        assert result["description"] == "Annual light art festival"
+        assert (
+            result["source_url"]
+            == "https://www.iamsterdam.com/en/events/amsterdam-light-festival"
+        )
 
     @pytest.mark.asyncio
     async def test_scrape_event_page_extracts_location_data(self, scraper):
@@ -160,55 +204,86 @@ class TestIamsterdamScraper:
             }
         }
 
-        html = f'<html><body><script id="__NEXT_DATA__" type="application/json">{json.dumps(next_data)}</script></body></html>'
+        scraper._client = self._mock_page_client(_page_html(next_data))
 
-        mock_response = Response(
-            status_code=200,
-            content=html.encode(),
-            request=MagicMock(),
+        result = await scraper._scrape_event_page(
+            "https://www.iamsterdam.com/en/locations/amaze"
         )
 
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get = AsyncMock(return_value=mock_response)
-        mock_client = MagicMock()
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
-
-        with patch("httpx.AsyncClient", return_value=mock_client):
-            result = await scraper._scrape_event_page(
-                mock_client_instance, "https://www.iamsterdam.com/en/locations/amaze"
-            )
-
-            assert result is not None
-            assert result["kind"] == "Location"
-            assert result["title"] == "AMAZE"
-            assert result["name"] == "AMAZE"
-            assert result["description"] == "Interactive experience"
-            assert result["address"]["city"] == "Amsterdam"
+        assert result is not None
+        assert result["kind"] == "Location"
+        assert result["title"] == "AMAZE"
+        assert result["name"] == "AMAZE"
+        assert result["description"] == "Interactive experience"
+        assert result["address"]["city"] == "Amsterdam"
 
     @pytest.mark.asyncio
     async def test_scrape_event_page_handles_missing_next_data(self, scraper):
         """Test that _scrape_event_page returns None when __NEXT_DATA__ is missing."""
-        html = "<html><body><h1>No Next.js data here</h1></body></html>"
+        scraper._client = self._mock_page_client(_NO_NEXT_DATA_HTML)
 
-        mock_response = Response(
-            status_code=200,
-            content=html.encode(),
-            request=MagicMock(),
-        )
+        result = await scraper._scrape_event_page("https://www.iamsterdam.com/en/some-page")
 
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get = AsyncMock(return_value=mock_response)
-        mock_client = MagicMock()
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
+        assert result is None
 
-        with patch("httpx.AsyncClient", return_value=mock_client):
-            result = await scraper._scrape_event_page(
-                mock_client_instance, "https://www.iamsterdam.com/en/some-page"
-            )
+    @pytest.mark.asyncio
+    async def test_scrape_event_page_skips_duplicate_content(self, scraper):
+        """Test that a second page with identical bytes is skipped."""
+        event_data = {"id": "event-123", "title": "Amsterdam Light Festival"}
+        next_data = {"props": {"pageProps": {"pageType": "Event", "event": event_data}}}
+
+        scraper._client = self._mock_page_client(_page_html(next_data))
+
+        first = await scraper._scrape_event_page("https://www.iamsterdam.com/en/a")
+        second = await scraper._scrape_event_page("https://www.iamsterdam.com/en/b")
+
+        assert first is not None
+        assert second is None
+
+    @pytest.mark.asyncio
+    async def test_get_with_retry_retries_transient_statuses(self, scraper):
+        """Test that _get_with_retry retries a 503 and honours Retry-After."""
+        attempts = []
+
+        def handler(request):
+            attempts.append(request)
+            if len(attempts) == 1:
+                return Response(status_code=503, headers={"Retry-After": "0"})
+            return Response(status_code=200, content=b"ok")
+
+        scraper._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        response = await scraper._get_with_retry("https://www.iamsterdam.com/en/page")
+
+        assert response.status_code == 200
+        assert len(attempts) == 2
+
+    @pytest.mark.asyncio
+    async def test_get_with_retry_caps_retry_after(self, scraper, monkeypatch):
+        """Test that an aggressive Retry-After header is clamped."""
+        import asyncio
+
+        delays = []
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                return Response(status_code=429, headers={"Retry-After": "86400"})
+            return Response(status_code=200, content=b"ok")
+
+        scraper._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        response = await scraper._get_with_retry("https://www.iamsterdam.com/en/page")
 
-            assert result is None
+        assert response.status_code == 200
+        assert delays == [scraper.MAX_RETRY_AFTER]
 
     def test_normalize_event(self, scraper):
         """Test that _normalize_event normalizes event data correctly."""
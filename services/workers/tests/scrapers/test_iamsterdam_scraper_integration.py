@@ -2,7 +2,7 @@
 
 import os
 
-import httpx
+import msgspec
 import pytest
 from cityvibe_core.models.venue import VenueBase
 from loguru import logger
@@ -15,7 +15,24 @@ pytestmark = pytest.mark.skipif(
 )
 
 
+class EventSchema(msgspec.Struct):
+    """Minimal shape every scraped event must satisfy.
+
+    msgspec.convert validates the whole result set in C, replacing the
+    per-event isinstance assertion loop; unknown fields are ignored.
+    """
+
+    title: str
+    start_time: str | None = None
+    source_url: str | None = None
+    description: str | None = None
+    location: str | None = None
+
+
 @pytest.mark.integration
+# Serialize these tests onto one pytest-xdist worker so parallel runs do not
+# multiply concurrent traffic against the live site.
+@pytest.mark.xdist_group("iamsterdam_network")
 class TestIamsterdamScraperIntegration:
     """Integration tests that scrape the actual Iamsterdam website."""
 
@@ -30,41 +47,69 @@ class TestIamsterdamScraperIntegration:
         )
 
         scraper = IamsterdamScraper(venue)
-
-        # Actually scrape the website
-        events = await scraper.scrape()
+        try:
+            # Actually scrape the website
+            events = await scraper.scrape()
+        finally:
+            await scraper.aclose()
 
         # Basic assertions - website structure may vary
         assert isinstance(events, list), "Should return a list of events"
 
-        # If events are found, validate their structure
+        # If events are found, validate their structure in one C-level pass
         if events:
-            for event in events:
-                assert "title" in event, "Event should have a title"
-                assert isinstance(event["title"], str), "Title should be a string"
-                assert event["title"], "Title should not be empty"
-
-                # start_time and source_url are optional but should be strings if present
-                if "start_time" in event and event["start_time"] is not None:
-                    assert isinstance(event["start_time"], str), "start_time should be a string"
-
-                if "source_url" in event and event["source_url"] is not None:
-                    assert isinstance(event["source_url"], str), "source_url should be a string"
-                    assert event["source_url"].startswith("http"), (
+            validated = msgspec.convert(events, list[EventSchema])
+            for event in validated:
+                assert event.title, "Title should not be empty"
+                if event.source_url is not None:
+                    assert event.source_url.startswith("http"), (
                         "source_url should be a valid URL"
                     )
 
-                if "description" in event and event["description"] is not None:
-                    assert isinstance(event["description"], str), "description should be a string"
-
-                if "location" in event and event["location"] is not None:
-                    assert isinstance(event["location"], str), "location should be a string"
-
         # Log results for debugging
         logger.info(f"✅ Scraped {len(events)} events from Iamsterdam")
         if events:
             logger.debug(f"📝 Sample event: {events[0]}")
 
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(
+        os.getenv("USE_RUSTY_REQ", "false").lower() != "true",
+        reason="Rust-backed batch download disabled. Set USE_RUSTY_REQ=true to enable.",
+    )
+    async def test_fetch_event_pages_with_rusty_req(self):
+        """Optionally batch-download sitemap pages via the rusty-req client.
+
+        rusty-req drives the fetches from a shared Rust/Tokio client, which
+        scales better than asyncio+httpx for hundreds of URLs; it stays an
+        opt-in extra (importorskip) rather than a declared dependency.
+        """
+        rusty_req = pytest.importorskip("rusty_req")
+
+        venue = VenueBase(
+            name="Iamsterdam",
+            website_url="https://www.iamsterdam.com/en/see-and-do/whats-on/events",
+            city="Amsterdam",
+            country="NL",
+        )
+
+        scraper = IamsterdamScraper(venue)
+        try:
+            urls = await scraper._get_sitemap_urls()
+        finally:
+            await scraper.aclose()
+        if not urls:
+            pytest.skip("No event URLs found in sitemap")
+
+        results = await rusty_req.fetch_requests(
+            [{"url": url, "method": "GET"} for url in urls[:50]],
+            mode="SELECT_ALL",
+            total_timeout=60,
+        )
+
+        bodies = [result.get("body") for result in results if isinstance(result, dict)]
+        assert any(bodies), "Expected at least one downloaded page body"
+        logger.info(f"✅ Downloaded {len(bodies)} pages via rusty-req")
+
     @pytest.mark.asyncio
     async def test_scrape_single_event_page(self):
         """Test scraping a single event page from the real website."""
@@ -79,8 +124,7 @@ class TestIamsterdamScraperIntegration:
 
         # Test scraping a single event page (using a sample URL from sitemap)
         # This test will fail if the URL structure changes, but validates the scraping logic
-
-        async with httpx.AsyncClient(timeout=15.0) as client:
+        try:
             # Try to get URLs from sitemap first
             urls = await scraper._get_sitemap_urls()
             if not urls:
@@ -88,7 +132,7 @@ class TestIamsterdamScraperIntegration:
 
             # Test scraping the first URL
             test_url = urls[0]
-            event_data = await scraper._scrape_event_page(client, test_url)
+            event_data = await scraper._scrape_event_page(test_url)
 
             # Validate structure
             if event_data:
@@ -102,3 +146,5 @@ class TestIamsterdamScraperIntegration:
                 )
             else:
                 logger.warning(f"⚠️ No data extracted from {test_url}")
+        finally:
+            await scraper.aclose()
@@ -0,0 +1,30 @@
+"""Tests for the process_events Celery task."""
+
+from workers.tasks.etl.process_events import process_events_task
+
+
+class TestProcessEventsTask:
+    """Test cases for process_events_task."""
+
+    def test_process_events_task_runs_pipeline(self):
+        """Test that the task processes a batch and reports counts."""
+        raw_events = [
+            {
+                "title": "Canal Concert",
+                "start_time": "2024-12-01T20:00:00",
+                "source_url": "https://example.com/canal-concert",
+            },
+            {
+                "title": "Museum Night",
+                "start_time": "2024-12-02T19:00:00",
+                "source_url": "https://example.com/museum-night",
+            },
+        ]
+
+        result = process_events_task("venue-123", raw_events)
+
+        # The raw events carry no venue_id; both surviving validation
+        # proves the task stamped the venue before processing.
+        assert result["events_processed"] == 2
+        assert result["events_new"] == 2
+        assert result["errors"] == []